@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 from jinja2 import Template
@@ -31,9 +32,12 @@ class ContextorNode:
     )
     async def __call__(self, state: State):
         device_controller = create_device_controller(self.ctx)
-        device_data = await device_controller.get_screen_data()
-        current_app_package = get_current_foreground_package(self.ctx)
-        device_date = get_device_date(self.ctx)
+        # The probes are independent device round trips, so they run concurrently
+        device_data, current_app_package, device_date = await asyncio.gather(
+            device_controller.get_screen_data(),
+            asyncio.to_thread(get_current_foreground_package, self.ctx),
+            asyncio.to_thread(get_device_date, self.ctx),
+        )
         agent_outcome: str | None = None
 
         if self.ctx.execution_setup and self.ctx.execution_setup.app_lock_status:
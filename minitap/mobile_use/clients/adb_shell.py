@@ -0,0 +1,119 @@
+"""
+Persistent ADB shell sessions for short, latency-sensitive commands.
+
+Every `AdbDevice.shell()` call opens a new connection to the ADB server, switches it to the
+device transport and starts a fresh shell service. For one-line input commands (taps,
+swipes), that setup dominates the command itself. A persistent session keeps a single
+`sh` process open per device and writes commands to its stdin instead.
+"""
+
+import threading
+
+from adbutils import AdbConnection, AdbDevice
+
+from minitap.mobile_use.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Time allowed for a command on top of the duration of the gesture it performs
+COMMAND_TIMEOUT_MARGIN_SECONDS = 10
+# Printed after each command to detect its end. The command line splits it with an empty
+# quoted string so that a shell echoing its input never produces the marker itself.
+_END_MARKER = b"__mobile_use_done__"
+_END_MARKER_COMMAND = 'echo __mobile_use_""done__'
+
+
+class AdbCommandNotSentError(Exception):
+    """Raised when a command could not be written to the persistent shell session."""
+
+
+class PersistentAdbShell:
+    """Long-lived `sh` session on a device, running one command at a time."""
+
+    def __init__(self, device: AdbDevice):
+        self.device = device
+        self._connection: AdbConnection | None = None
+        self._lock = threading.Lock()
+
+    def run(self, command: str, timeout: float = COMMAND_TIMEOUT_MARGIN_SECONDS) -> str:
+        """
+        Run a command in the session and return its output.
+
+        `timeout` bounds the wait for the command's output, in seconds.
+
+        Raises:
+            AdbCommandNotSentError: The session could not be opened or the command could not be
+                written, so it did not run.
+            Exception: The command was sent but its end could not be read; the session is closed.
+        """
+        with self._lock:
+            try:
+                if self._connection is None:
+                    self._connection = self.device.open_shell("sh")
+                self._connection.conn.settimeout(timeout)
+                self._connection.send(f"{command}; {_END_MARKER_COMMAND}\n".encode())
+            except Exception as e:
+                self._close()
+                raise AdbCommandNotSentError(str(e)) from e
+
+            try:
+                return self._read_until_marker(self._connection)
+            except Exception:
+                self._close()
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            finally:
+                self._connection = None
+
+    @staticmethod
+    def _read_until_marker(connection: AdbConnection) -> str:
+        output = b""
+        while _END_MARKER not in output:
+            # A single recv: `connection.read(n)` waits for exactly n bytes, which a shell
+            # that stays open never sends for short outputs
+            chunk = connection.conn.recv(4096)
+            if not chunk:
+                raise ConnectionError("ADB shell session closed before the command completed")
+            output += chunk
+        return output[: output.index(_END_MARKER)].decode("utf-8", errors="replace").strip()
+
+
+# Sessions are kept per device serial, as controllers are recreated for each action
+_shells: dict[str, PersistentAdbShell] = {}
+
+
+def shell_fast(device: AdbDevice, command: str, duration_ms: int = 0) -> str:
+    """
+    Run a short shell command through the device's persistent session.
+
+    `duration_ms` is how long the command itself lasts (e.g. a swipe or long press), and is
+    added to the time allowed for it.
+    Falls back to a regular `device.shell()` call when the session cannot deliver the command.
+    """
+    timeout = COMMAND_TIMEOUT_MARGIN_SECONDS + duration_ms / 1000
+    serial = device.serial
+    if serial is None:
+        return str(device.shell(command))
+    shell = _shells.get(serial)
+    if shell is None:
+        shell = _shells.setdefault(serial, PersistentAdbShell(device))
+    try:
+        return shell.run(command, timeout=timeout)
+    except AdbCommandNotSentError as e:
+        logger.warning(f"Persistent ADB shell unavailable, using a one-off shell: {e}")
+        return str(device.shell(command))
+
+
+def close_shell(serial: str) -> None:
+    """Close the persistent session of a device, if any."""
+    shell = _shells.pop(serial, None)
+    if shell is not None:
+        shell.close()
@@ -0,0 +1,167 @@
+import asyncio
+import socket
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from minitap.mobile_use.clients import adb_shell
+from minitap.mobile_use.clients.adb_shell import PersistentAdbShell, close_shell, shell_fast
+from minitap.mobile_use.context import DeviceContext, DevicePlatform
+
+# Other test modules replace these with mocks when they are imported
+_STUBBED_MODULES = (
+    "langgraph.prebuilt.chat_agent_executor",
+    "minitap.mobile_use.graph.state",
+    "langchain_google_vertexai",
+    "langchain_google_genai",
+    "langchain_openai",
+    "langchain_cerebras",
+)
+
+
+class _ShellConnection:
+    """Host side of a shell session over a socketpair, shaped like adbutils' AdbConnection."""
+
+    def __init__(self, conn: socket.socket):
+        self.conn = conn
+        self.closed = False
+
+    def send(self, data: bytes) -> int:
+        return self.conn.send(data)
+
+    def close(self) -> None:
+        self.closed = True
+        self.conn.close()
+
+
+def _serve_shell(device_side: socket.socket, outputs: list[bytes]) -> None:
+    """Answer each command line like `sh` would, without ever closing the stream."""
+    buffer = b""
+    for output in outputs:
+        while b"\n" not in buffer:
+            chunk = device_side.recv(4096)
+            if not chunk:
+                return
+            buffer += chunk
+        _, buffer = buffer.split(b"\n", 1)
+        device_side.sendall(output + b"__mobile_use_done__\n")
+    # Keep the session open, silently, until the host closes it
+    while device_side.recv(4096):
+        pass
+
+
+def _device(serial: str, outputs: list[bytes]) -> tuple[Mock, list[_ShellConnection]]:
+    connections: list[_ShellConnection] = []
+
+    def open_shell(_command: str) -> _ShellConnection:
+        host_side, device_side = socket.socketpair()
+        threading.Thread(target=_serve_shell, args=(device_side, outputs), daemon=True).start()
+        connections.append(_ShellConnection(host_side))
+        return connections[-1]
+
+    device = Mock()
+    device.serial = serial
+    device.open_shell.side_effect = open_shell
+    return device, connections
+
+
+@pytest.fixture(autouse=True)
+def _reset_shells():
+    adb_shell._shells.clear()
+    yield
+    adb_shell._shells.clear()
+
+
+def test_persistent_shell_returns_as_soon_as_marker_is_read():
+    device, _ = _device("emulator-5554", [b"first line\n", b""])
+    shell = PersistentAdbShell(device)
+
+    started = time.monotonic()
+    assert shell.run("cmd input tap 1 2", timeout=5) == "first line"
+    assert shell.run("cmd input tap 3 4", timeout=5) == ""
+
+    # The short outputs must not make the read wait for the timeout
+    assert time.monotonic() - started < 1
+    device.open_shell.assert_called_once_with("sh")
+
+
+def test_persistent_shell_closes_session_when_output_times_out():
+    device, connections = _device("emulator-5554", [])
+    shell = PersistentAdbShell(device)
+
+    # The device side never answers
+    with pytest.raises(TimeoutError):
+        shell.run("cmd input tap 1 2", timeout=0.2)
+
+    assert connections[0].closed
+    assert shell._connection is None
+
+
+def test_shell_fast_falls_back_when_session_cannot_open():
+    device = Mock()
+    device.serial = "emulator-5554"
+    device.open_shell.side_effect = RuntimeError("transport unavailable")
+    device.shell.return_value = "ok"
+
+    assert shell_fast(device, "cmd input tap 1 2") == "ok"
+    device.shell.assert_called_once_with("cmd input tap 1 2")
+
+
+def test_shell_fast_reuses_session_per_serial():
+    device, connections = _device("emulator-5554", [b"", b""])
+
+    shell_fast(device, "cmd input tap 1 2")
+    shell_fast(device, "cmd input tap 3 4")
+    close_shell("emulator-5554")
+
+    device.open_shell.assert_called_once()
+    assert connections[0].closed
+    assert "emulator-5554" not in adb_shell._shells
+
+
+def test_shell_fast_allows_for_the_command_duration():
+    device = Mock()
+    device.serial = "emulator-5554"
+    shell = Mock()
+    adb_shell._shells["emulator-5554"] = shell
+
+    shell_fast(device, "cmd input swipe 0 0 0 0 8000", duration_ms=8000)
+
+    shell.run.assert_called_once_with(
+        "cmd input swipe 0 0 0 0 8000",
+        timeout=adb_shell.COMMAND_TIMEOUT_MARGIN_SECONDS + 8,
+    )
+
+
+def test_agent_clean_closes_the_shell_of_its_device():
+    with patch.dict(sys.modules):
+        for name in _STUBBED_MODULES:
+            if isinstance(sys.modules.get(name), Mock):
+                del sys.modules[name]
+        from minitap.mobile_use.sdk.agent import Agent
+
+    # Skips __init__, which loads the default LLM config and its API keys
+    agent = Agent.__new__(Agent)
+    agent._initialized = True
+    agent._cloud_mobile_id = None
+    agent._ios_client = None
+    agent._device_context = DeviceContext(
+        host_platform="LINUX",
+        mobile_platform=DevicePlatform.ANDROID,
+        device_id="emulator-5554",
+        device_width=1080,
+        device_height=2340,
+    )
+    shell = Mock()
+    other_shell = Mock()
+    adb_shell._shells["emulator-5554"] = shell
+    adb_shell._shells["emulator-5556"] = other_shell
+
+    asyncio.run(agent.clean())
+
+    shell.close.assert_called_once()
+    other_shell.close.assert_not_called()
+    assert list(adb_shell._shells) == ["emulator-5556"]
@@ -6,6 +6,7 @@ Uses ContextVar to avoid prop drilling and maintain clean function signatures.
 
 from collections.abc import Callable, Coroutine
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Literal
 
@@ -59,6 +60,13 @@ class ExecutionSetup(BaseModel):
     enable_remote_tracing: bool = False
     app_lock_status: AppLaunchResult | None = None
 
+    @cached_property
+    def trace_folder(self) -> Path | None:
+        """Resolved folder where the interactions of this trace are recorded."""
+        if not self.traces_path or not self.trace_name:
+            return None
+        return self.traces_path.joinpath(self.trace_name).resolve()
+
     def get_locked_app_package(self) -> str | None:
         """
         Get the locked app package name if app locking is enabled.
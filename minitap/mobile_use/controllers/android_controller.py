@@ -9,13 +9,20 @@ from pathlib import Path
 from adbutils import AdbClient, AdbDevice
 from PIL import Image
 
+from minitap.mobile_use.clients.adb_shell import close_shell, shell_fast
 from minitap.mobile_use.clients.ui_automator_client import UIAutomatorClient
 from minitap.mobile_use.controllers.device_controller import (
     MobileDeviceController,
     ScreenDataResponse,
 )
-from minitap.mobile_use.controllers.types import Bounds, CoordinatesSelectorRequest, TapOutput
+from minitap.mobile_use.controllers.types import (
+    TAP_SUCCESS,
+    Bounds,
+    CoordinatesSelectorRequest,
+    TapOutput,
+)
 from minitap.mobile_use.utils.logger import get_logger
+from minitap.mobile_use.utils.ui_hierarchy import index_ui_hierarchy
 from minitap.mobile_use.utils.video import (
     ANDROID_MAX_RECORDING_DURATION_SECONDS,
     DEFAULT_MAX_DURATION_SECONDS,
@@ -32,6 +39,14 @@ from minitap.mobile_use.utils.video import (
 
 logger = get_logger(__name__)
 
+# `cmd input` talks to the input service directly instead of going through the `input`
+# wrapper, which starts an extra process per call. Only recent releases implement it: older
+# ones print this error and ignore the command, so support is probed on the device.
+CMD_INPUT_UNSUPPORTED_OUTPUT = "No shell command implementation"
+
+# Resolved once per device, as controllers are created for every action
+_input_command_by_device: dict[str, str] = {}
+
 
 class AndroidDeviceController(MobileDeviceController):
     def __init__(
@@ -55,6 +70,23 @@ class AndroidDeviceController(MobileDeviceController):
             self._device = self.adb_client.device(serial=self.device_id)
         return self._device
 
+    async def get_input_command(self) -> str:
+        command = _input_command_by_device.get(self.device_id)
+        if command is None:
+            command = await asyncio.to_thread(self._probe_input_command)
+            _input_command_by_device[self.device_id] = command
+        return command
+
+    def _probe_input_command(self) -> str:
+        try:
+            output = str(self.device.shell("cmd input"))
+        except Exception as e:
+            logger.warning(f"Failed to probe `cmd input`, falling back to `input`: {e}")
+            return "input"
+        if CMD_INPUT_UNSUPPORTED_OUTPUT in output:
+            return "input"
+        return "cmd input"
+
     async def tap(
         self,
         coords: CoordinatesSelectorRequest,
@@ -62,15 +94,22 @@ class AndroidDeviceController(MobileDeviceController):
         long_press_duration: int = 1000,
     ) -> TapOutput:
         try:
+            input_command = await self.get_input_command()
             if long_press:
                 cmd = (
-                    f"input swipe {coords.x} {coords.y} {coords.x} {coords.y} {long_press_duration}"
+                    f"{input_command} swipe {coords.x} {coords.y} {coords.x} {coords.y} "
+                    f"{long_press_duration}"
                 )
             else:
-                cmd = f"input tap {coords.x} {coords.y}"
+                cmd = f"{input_command} tap {coords.x} {coords.y}"
 
-            self.device.shell(cmd)
-            return TapOutput(error=None)
+            await asyncio.to_thread(
+                shell_fast,
+                self.device,
+                cmd,
+                duration_ms=long_press_duration if long_press else 0,
+            )
+            return TAP_SUCCESS
         except Exception as e:
             return TapOutput(error=f"ADB tap failed: {str(e)}")
 
@@ -81,8 +120,12 @@ class AndroidDeviceController(MobileDeviceController):
         duration: int = 400,
     ) -> str | None:
         try:
-            cmd = f"input touchscreen swipe {start.x} {start.y} {end.x} {end.y} {duration}"
-            self.device.shell(cmd)
+            input_command = await self.get_input_command()
+            cmd = (
+                f"{input_command} touchscreen swipe "
+                f"{start.x} {start.y} {end.x} {end.y} {duration}"
+            )
+            await asyncio.to_thread(shell_fast, self.device, cmd, duration_ms=duration)
             return None
         except Exception as e:
             return f"ADB swipe failed: {str(e)}"
@@ -91,7 +134,7 @@ class AndroidDeviceController(MobileDeviceController):
         """Get screen data using the UIAutomator2 client"""
         try:
             logger.info("Using UIAutomator2 for screen data retrieval")
-            ui_data = self.ui_adb_client.get_screen_data()
+            ui_data = await asyncio.to_thread(self.ui_adb_client.get_screen_data)
             return ScreenDataResponse(
                 base64=ui_data.base64,
                 elements=ui_data.elements,
@@ -154,15 +197,15 @@ class AndroidDeviceController(MobileDeviceController):
     async def terminate_app(self, package_or_bundle_id: str | None) -> bool:
         try:
             if package_or_bundle_id is None:
-                current_app = self._get_current_foreground_package()
+                current_app = await asyncio.to_thread(self._get_current_foreground_package)
                 if current_app:
                     logger.info(f"Stopping currently running app: {current_app}")
-                    self.device.app_stop(current_app)
+                    await asyncio.to_thread(self.device.app_stop, current_app)
                 else:
                     logger.warning("No foreground app detected")
                     return False
             else:
-                self.device.app_stop(package_or_bundle_id)
+                await asyncio.to_thread(self.device.app_stop, package_or_bundle_id)
             return True
         except Exception as e:
             logger.error(f"Failed to terminate app {package_or_bundle_id}: {e}")
@@ -178,7 +221,7 @@ class AndroidDeviceController(MobileDeviceController):
 
     async def press_back(self) -> bool:
         try:
-            self.device.shell("input keyevent 4")
+            await asyncio.to_thread(self.device.shell, "input keyevent 4")
             return True
         except Exception as e:
             logger.error(f"Failed to press back: {e}")
@@ -186,7 +229,7 @@ class AndroidDeviceController(MobileDeviceController):
 
     async def press_home(self) -> bool:
         try:
-            self.device.shell("input keyevent 3")
+            await asyncio.to_thread(self.device.shell, "input keyevent 3")
             return True
         except Exception as e:
             logger.error(f"Failed to press home: {e}")
@@ -210,12 +253,10 @@ class AndroidDeviceController(MobileDeviceController):
         if not resource_id and not text:
             return None, None, "No resource_id or text provided"
 
-        matches = []
-        for element in ui_hierarchy:
-            if resource_id and element.get("resource-id") == resource_id:
-                matches.append(element)
-            elif text and (element.get("text") == text or element.get("accessibilityText") == text):
-                matches.append(element)
+        indexed = index_ui_hierarchy(
+            ui_hierarchy, id_key="resource-id", text_keys=("text", "accessibilityText")
+        )
+        matches = indexed.matches(resource_id=resource_id, text=text)
 
         if not matches:
             criteria = f"resource_id='{resource_id}'" if resource_id else f"text='{text}'"
@@ -229,7 +270,7 @@ class AndroidDeviceController(MobileDeviceController):
                 f"Index {index} out of range for {criteria} (found {len(matches)} matches)",
             )
 
-        element = matches[index]
+        element = indexed.elements[matches[index]]
         bounds = self._extract_bounds(element)
 
         return element, bounds, None
@@ -286,7 +327,7 @@ class AndroidDeviceController(MobileDeviceController):
             return False
 
     async def cleanup(self) -> None:
-        pass
+        close_shell(self.device_id)
 
     def get_compressed_b64_screenshot(self, image_base64: str, quality: int = 50) -> str:
         if image_base64.startswith("data:image"):
@@ -17,8 +17,14 @@ from minitap.mobile_use.controllers.device_controller import (
     MobileDeviceController,
     ScreenDataResponse,
 )
-from minitap.mobile_use.controllers.types import Bounds, CoordinatesSelectorRequest, TapOutput
+from minitap.mobile_use.controllers.types import (
+    TAP_SUCCESS,
+    Bounds,
+    CoordinatesSelectorRequest,
+    TapOutput,
+)
 from minitap.mobile_use.utils.logger import get_logger
+from minitap.mobile_use.utils.ui_hierarchy import index_ui_hierarchy
 from minitap.mobile_use.utils.video import (
     DEFAULT_MAX_DURATION_SECONDS,
     VIDEO_READY_DELAY_SECONDS,
@@ -59,7 +65,7 @@ class iOSDeviceController(MobileDeviceController):
         try:
             duration = long_press_duration / 1000.0 if long_press else None
             await self.ios_client.tap(x=coords.x, y=coords.y, duration=duration)  # type: ignore[call-arg]
-            return TapOutput(error=None)
+            return TAP_SUCCESS
         except Exception as e:
             return TapOutput(error=f"IDB tap failed: {str(e)}")
 
@@ -247,14 +253,9 @@ class iOSDeviceController(MobileDeviceController):
         if not resource_id and not text:
             return None, None, "No resource_id or text provided"
 
-        matches = []
-        for element in ui_hierarchy:
-            # iOS doesn't have resource-id, so we match on type if provided as resource_id
-            if resource_id and element.get("type") == resource_id:
-                matches.append(element)
-            # Match on value or label for text
-            elif text and (element.get("value") == text or element.get("label") == text):
-                matches.append(element)
+        # iOS doesn't have resource-id, so we match on type if provided as resource_id
+        indexed = index_ui_hierarchy(ui_hierarchy, id_key="type", text_keys=("value", "label"))
+        matches = indexed.matches(resource_id=resource_id, text=text)
 
         if not matches:
             criteria = f"type='{resource_id}'" if resource_id else f"text='{text}'"
@@ -268,7 +269,7 @@ class iOSDeviceController(MobileDeviceController):
                 f"Index {index} out of range for {criteria} (found {len(matches)} matches)",
             )
 
-        element = matches[index]
+        element = indexed.elements[matches[index]]
         bounds = self._extract_bounds(element)
 
         return element, bounds, None
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from minitap.mobile_use.controllers import android_controller
+from minitap.mobile_use.controllers.android_controller import AndroidDeviceController
+from minitap.mobile_use.controllers.types import CoordinatesSelectorRequest
+
+
+@pytest.fixture(autouse=True)
+def _reset_input_commands():
+    android_controller._input_command_by_device.clear()
+    yield
+    android_controller._input_command_by_device.clear()
+
+
+def _controller(cmd_input_output: str) -> tuple[AndroidDeviceController, Mock]:
+    device = Mock()
+    device.shell.return_value = cmd_input_output
+    adb_client = Mock()
+    adb_client.device.return_value = device
+    controller = AndroidDeviceController(
+        device_id="emulator-5554",
+        adb_client=adb_client,
+        ui_adb_client=Mock(),
+        device_width=1080,
+        device_height=2340,
+    )
+    return controller, device
+
+
+def test_input_command_uses_cmd_input_when_implemented():
+    controller, device = _controller("Usage: input [<source>] <command> [<arg>...]")
+
+    assert asyncio.run(controller.get_input_command()) == "cmd input"
+    assert asyncio.run(controller.get_input_command()) == "cmd input"
+    device.shell.assert_called_once_with("cmd input")
+
+
+def test_input_command_falls_back_when_cmd_input_is_not_implemented():
+    controller, _ = _controller("No shell command implementation.")
+
+    assert asyncio.run(controller.get_input_command()) == "input"
+
+
+def test_gestures_run_off_the_event_loop_thread():
+    controller, _ = _controller("Usage: input [<source>] <command> [<arg>...]")
+    calls: list[tuple[str, int, bool]] = []
+
+    def shell_fast(_device, command: str, duration_ms: int = 0) -> str:
+        calls.append((command, duration_ms, threading.current_thread() is main_thread))
+        return ""
+
+    main_thread = threading.current_thread()
+    point = CoordinatesSelectorRequest(x=1, y=2)
+    with patch.object(android_controller, "shell_fast", side_effect=shell_fast):
+        asyncio.run(controller.tap(point, long_press=True, long_press_duration=800))
+        asyncio.run(controller.swipe(point, CoordinatesSelectorRequest(x=3, y=4), duration=500))
+
+    assert calls == [
+        ("cmd input swipe 1 2 1 2 800", 800, False),
+        ("cmd input touchscreen swipe 1 2 3 4 500", 500, False),
+    ]
@@ -0,0 +1,55 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from minitap.mobile_use.controllers import unified_controller
+from minitap.mobile_use.controllers.types import TAP_SUCCESS
+from minitap.mobile_use.controllers.unified_controller import UnifiedMobileController
+
+
+@pytest.fixture(autouse=True)
+def clear_ui_hierarchy_cache():
+    unified_controller._ui_hierarchy_cache.clear()
+
+
+@pytest.fixture
+def device_controller():
+    controller = Mock()
+    controller.get_ui_hierarchy = AsyncMock(side_effect=lambda: [{"text": "Screen"}])
+    controller.tap = AsyncMock(return_value=TAP_SUCCESS)
+    return controller
+
+
+def _unified_controller(device_controller: Mock) -> UnifiedMobileController:
+    ctx = Mock()
+    ctx.device.device_id = "emulator-5554"
+    with patch.object(unified_controller, "get_controller", return_value=device_controller):
+        return UnifiedMobileController(ctx)
+
+
+def test_get_ui_elements_reuses_recent_hierarchy(device_controller):
+    controller = _unified_controller(device_controller)
+
+    first = asyncio.run(controller.get_ui_elements())
+    second = asyncio.run(_unified_controller(device_controller).get_ui_elements())
+    uncached = asyncio.run(controller.get_ui_elements(use_cache=False))
+
+    assert second is first
+    assert uncached is not first
+    assert device_controller.get_ui_hierarchy.await_count == 2
+
+
+def test_get_ui_elements_refetches_after_expiry_or_action(device_controller):
+    controller = _unified_controller(device_controller)
+
+    with patch.object(unified_controller.time, "monotonic", return_value=100.0):
+        first = asyncio.run(controller.get_ui_elements())
+    with patch.object(unified_controller.time, "monotonic", return_value=100.5):
+        expired = asyncio.run(controller.get_ui_elements())
+        asyncio.run(controller.tap_at(x=10, y=20))
+        after_tap = asyncio.run(controller.get_ui_elements())
+
+    assert expired is not first
+    assert after_tap is not expired
+    assert device_controller.get_ui_hierarchy.await_count == 3
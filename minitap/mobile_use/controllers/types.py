@@ -4,9 +4,14 @@ from pydantic import BaseModel, ConfigDict, Field
 class TapOutput(BaseModel):
     """Output from tap operations."""
 
+    model_config = ConfigDict(frozen=True)
     error: str | None = Field(default=None, description="Error message if tap failed")
 
 
+# Shared result for successful taps, safe to reuse as TapOutput is immutable
+TAP_SUCCESS = TapOutput()
+
+
 class Bounds(BaseModel):
     """Represents the bounds of a UI element."""
 
@@ -1,3 +1,8 @@
+import time
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, Concatenate, ParamSpec, TypeVar
+
 from minitap.mobile_use.context import MobileUseContext
 from minitap.mobile_use.controllers.controller_factory import get_controller
 from minitap.mobile_use.controllers.device_controller import MobileDeviceController
@@ -13,6 +18,28 @@ from minitap.mobile_use.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+UI_HIERARCHY_CACHE_TTL_SECONDS = 0.3
+# Latest UI hierarchy fetched per device, with its fetch time. Controllers are recreated for
+# each action, so the cache lives at module level. Any action that may change the screen
+# drops the entry of its device.
+_ui_hierarchy_cache: dict[str, tuple[float, list[dict]]] = {}
+
+
+def _invalidates_ui_hierarchy(
+    method: Callable[Concatenate["UnifiedMobileController", P], Coroutine[Any, Any, R]],
+) -> Callable[Concatenate["UnifiedMobileController", P], Coroutine[Any, Any, R]]:
+    @wraps(method)
+    async def wrapper(self: "UnifiedMobileController", *args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            _ui_hierarchy_cache.pop(self.ctx.device.device_id, None)
+
+    return wrapper
+
 
 class UnifiedMobileController:
     def __init__(self, ctx: MobileUseContext):
@@ -23,6 +50,7 @@ class UnifiedMobileController:
     def controller(self) -> MobileDeviceController:
         return self._controller
 
+    @_invalidates_ui_hierarchy
     async def tap_at(
         self,
         x: int,
@@ -33,6 +61,7 @@ class UnifiedMobileController:
         coords = CoordinatesSelectorRequest(x=x, y=y)
         return await self._controller.tap(coords, long_press, long_press_duration)
 
+    @_invalidates_ui_hierarchy
     async def tap_percentage(
         self,
         x_percent: int,
@@ -47,6 +76,7 @@ class UnifiedMobileController:
         )
         return await self._controller.tap(coords, long_press, long_press_duration)
 
+    @_invalidates_ui_hierarchy
     async def tap_element(
         self,
         resource_id: str | None = None,
@@ -54,6 +84,7 @@ class UnifiedMobileController:
         index: int = 0,
         long_press: bool = False,
         long_press_duration: int = 1000,
+        ui_hierarchy: list[dict] | None = None,
     ) -> TapOutput:
         """
         Tap on a UI element by finding it in the hierarchy.
@@ -64,12 +95,13 @@ class UnifiedMobileController:
             index: Which match to tap if multiple elements match
             long_press: Whether to perform long press
             long_press_duration: Duration of long press in milliseconds
+            ui_hierarchy: Already fetched hierarchy to search, fetched from the device if None
 
         Returns:
             TapOutput with error field set on failure
         """
-        # Get UI hierarchy
-        ui_hierarchy = await self._controller.get_ui_hierarchy()
+        if ui_hierarchy is None:
+            ui_hierarchy = await self.get_ui_elements()
 
         # Find element
         element, bounds, error = self._controller.find_element(
@@ -86,6 +118,7 @@ class UnifiedMobileController:
         center = bounds.get_center()
         return await self._controller.tap(center, long_press, long_press_duration)
 
+    @_invalidates_ui_hierarchy
     async def swipe_coords(
         self,
         start_x: int,
@@ -99,6 +132,7 @@ class UnifiedMobileController:
         end = CoordinatesSelectorRequest(x=end_x, y=end_y)
         return await self._controller.swipe(start, end, duration)
 
+    @_invalidates_ui_hierarchy
     async def swipe_percentage(
         self,
         start_x_percent: int,
@@ -122,6 +156,7 @@ class UnifiedMobileController:
         )
         return await self._controller.swipe(start, end, duration)
 
+    @_invalidates_ui_hierarchy
     async def swipe_request(self, request: SwipeRequest) -> str | None:
         mode = request.swipe_mode
 
@@ -144,32 +179,53 @@ class UnifiedMobileController:
         else:
             return "Unsupported swipe mode"
 
+    @_invalidates_ui_hierarchy
     async def type_text(self, text: str) -> bool:
         return await self._controller.input_text(text)
 
     async def take_screenshot(self) -> str:
         return await self._controller.screenshot()
 
+    @_invalidates_ui_hierarchy
     async def launch_app(self, package_or_bundle_id: str) -> bool:
         return await self._controller.launch_app(package_or_bundle_id)
 
+    @_invalidates_ui_hierarchy
     async def terminate_app(self, package_or_bundle_id: str | None) -> bool:
         return await self._controller.terminate_app(package_or_bundle_id)
 
+    @_invalidates_ui_hierarchy
     async def open_url(self, url: str) -> bool:
         return await self._controller.open_url(url)
 
+    @_invalidates_ui_hierarchy
     async def go_back(self) -> bool:
         return await self._controller.press_back()
 
+    @_invalidates_ui_hierarchy
     async def go_home(self) -> bool:
         return await self._controller.press_home()
 
+    @_invalidates_ui_hierarchy
     async def erase_text(self, nb_chars: int | None = None) -> bool:
         return await self._controller.erase_text(nb_chars)
 
-    async def get_ui_elements(self) -> list[dict]:
-        return await self._controller.get_ui_hierarchy()
+    async def get_ui_elements(self, use_cache: bool = True) -> list[dict]:
+        """
+        Get the UI hierarchy of the device.
+
+        With use_cache, a hierarchy fetched less than UI_HIERARCHY_CACHE_TTL_SECONDS ago is
+        reused, unless an action went through this controller since then.
+        """
+        device_id = self.ctx.device.device_id
+        if use_cache:
+            cached = _ui_hierarchy_cache.get(device_id)
+            if cached is not None and time.monotonic() - cached[0] < UI_HIERARCHY_CACHE_TTL_SECONDS:
+                return cached[1]
+        fetched_at = time.monotonic()
+        ui_hierarchy = await self._controller.get_ui_hierarchy()
+        _ui_hierarchy_cache[device_id] = (fetched_at, ui_hierarchy)
+        return ui_hierarchy
 
     async def find_element(
         self,
@@ -177,7 +233,7 @@ class UnifiedMobileController:
         text: str | None = None,
         index: int = 0,
     ) -> tuple[dict | None, str | None]:
-        ui_hierarchy = await self._controller.get_ui_hierarchy()
+        ui_hierarchy = await self.get_ui_elements()
         element, bounds, error = self._controller.find_element(
             ui_hierarchy=ui_hierarchy,
             resource_id=resource_id,
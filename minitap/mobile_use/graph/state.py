@@ -1,11 +1,12 @@
 from typing import Annotated
 
-from langchain_core.messages import AIMessage, AnyMessage
+from langchain_core.messages import AIMessage, AnyMessage, ToolMessage
 from langgraph.graph import add_messages
 from pydantic import BaseModel
 
 from minitap.mobile_use.agents.planner.types import Subgoal
 from minitap.mobile_use.config import AgentNode
+from minitap.mobile_use.constants import EXECUTOR_MESSAGES_KEY
 from minitap.mobile_use.context import MobileUseContext
 from minitap.mobile_use.utils.logger import get_logger
 from minitap.mobile_use.utils.recorder import record_interaction
@@ -94,6 +95,27 @@ class State(BaseModel):
             )
         return update
 
+    async def aexecutor_tool_update(
+        self,
+        ctx: MobileUseContext,
+        agent_thought: str,
+        agent_outcome: str,
+        tool_message: ToolMessage,
+    ) -> dict:
+        """
+        Builds the sanitized update returned by an executor tool: its thought and outcome,
+        and the tool message.
+        """
+        return {
+            "agents_thoughts": await _add_agent_thoughts(
+                ctx=ctx,
+                old=self.agents_thoughts,
+                new=[agent_thought, agent_outcome],
+                agent="executor",
+            ),
+            EXECUTOR_MESSAGES_KEY: [tool_message],
+        }
+
 
 async def _add_agent_thoughts(
     ctx: MobileUseContext,
@@ -18,6 +18,7 @@ from pydantic import BaseModel
 
 from minitap.mobile_use.agents.outputter.outputter import outputter
 from minitap.mobile_use.agents.planner.types import Subgoal
+from minitap.mobile_use.clients.adb_shell import close_shell
 from minitap.mobile_use.clients.browserstack_client import BrowserStackClientWrapper
 from minitap.mobile_use.clients.idb_client import IdbClientWrapper
 from minitap.mobile_use.clients.ios_client import DeviceType, IosClientWrapper, get_ios_client
@@ -69,7 +70,7 @@ from minitap.mobile_use.utils.media import (
     remove_images_from_trace_folder,
     remove_steps_json_from_trace_folder,
 )
-from minitap.mobile_use.utils.recorder import log_agent_thought
+from minitap.mobile_use.utils.recorder import flush_recordings, log_agent_thought
 
 logger = get_logger(__name__)
 
@@ -932,6 +933,9 @@ class Agent:
             await self._ios_client.cleanup()
             self._ios_client = None
 
+        if self._device_context.mobile_platform == DevicePlatform.ANDROID:
+            close_shell(self._device_context.device_id)
+
         self._initialized = False
         logger.info("✅ Mobile-use agent stopped.")
 
@@ -995,6 +999,7 @@ class Agent:
         temp_trace_path = (self._tmp_traces_dir / exec_setup_ctx.trace_name).resolve()
         traces_output_path = Path(task.request.trace_path).resolve()
 
+        await flush_recordings()
         logger.info(f"[{task_name}] Compiling trace FROM FOLDER: " + str(temp_trace_path))
         create_gif_from_trace_folder(temp_trace_path)
         create_steps_json_from_trace_folder(temp_trace_path)
@@ -0,0 +1,31 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Small in-memory cache of tool results, each entry expiring after its own time to live.
+    The least recently stored entry is evicted once the cache is full.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
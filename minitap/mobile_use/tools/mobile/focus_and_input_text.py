@@ -12,12 +12,21 @@ from pydantic import BaseModel
 from minitap.mobile_use.constants import EXECUTOR_MESSAGES_KEY
 from minitap.mobile_use.context import MobileUseContext
 from minitap.mobile_use.controllers.controller_factory import create_device_controller
+from minitap.mobile_use.controllers.unified_controller import UnifiedMobileController
 from minitap.mobile_use.graph.state import State
 from minitap.mobile_use.tools.tool_wrapper import ToolWrapper
 from minitap.mobile_use.tools.types import Target
-from minitap.mobile_use.tools.utils import focus_element_if_needed, move_cursor_to_end_if_bounds
+from minitap.mobile_use.tools.utils import (
+    focus_element_if_needed,
+    move_cursor_to_end_if_bounds,
+    recover_focus,
+)
 from minitap.mobile_use.utils.logger import get_logger
-from minitap.mobile_use.utils.ui_hierarchy import find_element_by_resource_id, get_element_text
+from minitap.mobile_use.utils.ui_hierarchy import (
+    find_element_by_resource_id,
+    get_element_text,
+    is_element_focused,
+)
 
 logger = get_logger(__name__)
 
@@ -33,13 +42,27 @@ async def _controller_input_text(ctx: MobileUseContext, text: str) -> InputResul
     """
     Thin wrapper to normalize the controller result.
     """
-    controller = create_device_controller(ctx)
-    success = await controller.input_text(text)
+    controller = UnifiedMobileController(ctx)
+    success = await controller.type_text(text)
     if success:
         return InputResult(ok=True)
     return InputResult(ok=False, error="Failed to type text")
 
 
+async def _find_input_element(
+    ctx: MobileUseContext, state: State, resource_id: str, index: int | None
+) -> dict | None:
+    """Refreshes the UI hierarchy in the state and returns the input element."""
+    controller = create_device_controller(ctx)
+    screen_data = await controller.get_screen_data()
+    state.latest_ui_hierarchy = screen_data.elements
+    return find_element_by_resource_id(
+        ui_hierarchy=state.latest_ui_hierarchy,
+        resource_id=resource_id,
+        index=index,
+    )
+
+
 def get_focus_and_input_text_tool(ctx: MobileUseContext) -> BaseTool:
     @tool
     async def focus_and_input_text(
@@ -84,20 +107,30 @@ def get_focus_and_input_text_tool(ctx: MobileUseContext) -> BaseTool:
         await move_cursor_to_end_if_bounds(ctx=ctx, state=state, target=target)
 
         result = await _controller_input_text(ctx=ctx, text=text)
-        status: Literal["success", "error"] = "success" if result.ok else "error"
 
-        text_input_content = ""
-        if status == "success" and target.resource_id:
-            controller = create_device_controller(ctx)
-            screen_data = await controller.get_screen_data()
-            state.latest_ui_hierarchy = screen_data.elements
-            element = find_element_by_resource_id(
-                ui_hierarchy=state.latest_ui_hierarchy,
-                resource_id=target.resource_id,
-                index=target.resource_id_index,
+        element = None
+        if result.ok and target.resource_id:
+            element = await _find_input_element(
+                ctx=ctx, state=state, resource_id=target.resource_id, index=target.resource_id_index
             )
-            if element:
-                text_input_content = get_element_text(element)
+            if focus_method == "resource_id" and element and not is_element_focused(element):
+                # The focusing tap was trusted but did not take: the text went elsewhere
+                logger.warning(f"'{target.resource_id}' is not focused after typing, retrying")
+                focus_method = await recover_focus(ctx=ctx, target=target)
+                if focus_method:
+                    await move_cursor_to_end_if_bounds(ctx=ctx, state=state, target=target)
+                    result = await _controller_input_text(ctx=ctx, text=text)
+                    if result.ok:
+                        element = await _find_input_element(
+                            ctx=ctx,
+                            state=state,
+                            resource_id=target.resource_id,
+                            index=target.resource_id_index,
+                        )
+                else:
+                    result = InputResult(ok=False, error="Failed to focus the text input element.")
+        status: Literal["success", "error"] = "success" if result.ok else "error"
+        text_input_content = get_element_text(element) if element else ""
 
         agent_outcome = (
             focus_and_input_text_wrapper.on_success_fn(
@@ -8,7 +8,6 @@ from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 from pydantic import BeforeValidator
 
-from minitap.mobile_use.constants import EXECUTOR_MESSAGES_KEY
 from minitap.mobile_use.context import MobileUseContext
 from minitap.mobile_use.controllers.unified_controller import UnifiedMobileController
 from minitap.mobile_use.graph.state import State
@@ -63,13 +62,8 @@ def get_press_key_tool(ctx: MobileUseContext):
             status="error" if has_failed else "success",
         )
         return Command(
-            update=await state.asanitize_update(
-                ctx=ctx,
-                update={
-                    "agents_thoughts": [agent_thought, agent_outcome],
-                    EXECUTOR_MESSAGES_KEY: [tool_message],
-                },
-                agent="executor",
+            update=await state.aexecutor_tool_update(
+                ctx, agent_thought, agent_outcome, tool_message
             ),
         )
 
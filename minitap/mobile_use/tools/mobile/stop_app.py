@@ -6,7 +6,6 @@ from langchain_core.tools.base import InjectedToolCallId
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 
-from minitap.mobile_use.constants import EXECUTOR_MESSAGES_KEY
 from minitap.mobile_use.context import MobileUseContext
 from minitap.mobile_use.controllers.unified_controller import UnifiedMobileController
 from minitap.mobile_use.graph.state import State
@@ -42,13 +41,8 @@ def get_stop_app_tool(ctx: MobileUseContext):
             status="error" if has_failed else "success",
         )
         return Command(
-            update=await state.asanitize_update(
-                ctx=ctx,
-                update={
-                    "agents_thoughts": [agent_thought, agent_outcome],
-                    EXECUTOR_MESSAGES_KEY: [tool_message],
-                },
-                agent="executor",
+            update=await state.aexecutor_tool_update(
+                ctx, agent_thought, agent_outcome, tool_message
             ),
         )
 
@@ -7,15 +7,8 @@ from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 from pydantic import Field
 
-from minitap.mobile_use.constants import EXECUTOR_MESSAGES_KEY
 from minitap.mobile_use.context import MobileUseContext
-from minitap.mobile_use.controllers.types import (
-    CoordinatesSelectorRequest,
-    PercentagesSelectorRequest,
-    SwipeRequest,
-    SwipeStartEndCoordinatesRequest,
-    SwipeStartEndPercentagesRequest,
-)
+from minitap.mobile_use.controllers.types import SwipeRequest
 from minitap.mobile_use.controllers.unified_controller import UnifiedMobileController
 from minitap.mobile_use.graph.state import State
 from minitap.mobile_use.tools.tool_wrapper import CompositeToolWrapper
@@ -49,13 +42,8 @@ def get_swipe_tool(ctx: MobileUseContext) -> BaseTool:
         )
 
         return Command(
-            update=await state.asanitize_update(
-                ctx=ctx,
-                update={
-                    "agents_thoughts": [agent_thought, agent_outcome],
-                    EXECUTOR_MESSAGES_KEY: [tool_message],
-                },
-                agent="executor",
+            update=await state.aexecutor_tool_update(
+                ctx, agent_thought, agent_outcome, tool_message
             ),
         )
 
@@ -68,15 +56,13 @@ def get_composite_swipe_tools(ctx: MobileUseContext) -> list[BaseTool]:
     Each tool handles a specific swipe mode to avoid complex Union type issues.
     """
 
-    async def _execute_swipe(
+    async def _swipe_command(
         tool_call_id: str,
         state: State,
         agent_thought: str,
-        swipe_request: SwipeRequest,
+        output: str | None,
     ) -> Command:
-        """Shared swipe execution logic."""
-        controller = UnifiedMobileController(ctx)
-        output = await controller.swipe_request(swipe_request)
+        """Shared swipe result handling."""
         has_failed = output is not None
 
         agent_outcome = (
@@ -91,59 +77,54 @@ def get_composite_swipe_tools(ctx: MobileUseContext) -> list[BaseTool]:
         )
 
         return Command(
-            update=await state.asanitize_update(
-                ctx=ctx,
-                update={
-                    "agents_thoughts": [agent_thought, agent_outcome],
-                    EXECUTOR_MESSAGES_KEY: [tool_message],
-                },
-                agent="executor",
+            update=await state.aexecutor_tool_update(
+                ctx, agent_thought, agent_outcome, tool_message
             ),
         )
 
     @tool
     async def swipe_coordinates(
         agent_thought: str,
-        start_x: int = Field(description="Start X coordinate in pixels"),
-        start_y: int = Field(description="Start Y coordinate in pixels"),
-        end_x: int = Field(description="End X coordinate in pixels"),
-        end_y: int = Field(description="End Y coordinate in pixels"),
-        duration: int = Field(description="Duration in ms", ge=1, le=10000, default=400),
+        start_x: Annotated[int, Field(description="Start X coordinate in pixels")],
+        start_y: Annotated[int, Field(description="Start Y coordinate in pixels")],
+        end_x: Annotated[int, Field(description="End X coordinate in pixels")],
+        end_y: Annotated[int, Field(description="End Y coordinate in pixels")],
+        duration: Annotated[int, Field(description="Duration in ms", ge=1, le=10000)] = 400,
         tool_call_id: Annotated[str, InjectedToolCallId] = None,  # type: ignore
         state: Annotated[State, InjectedState] = None,  # type: ignore
     ) -> Command:
         """Swipe using pixel coordinates from start position to end position."""
-        swipe_request = SwipeRequest(
-            swipe_mode=SwipeStartEndCoordinatesRequest(
-                start=CoordinatesSelectorRequest(x=start_x, y=start_y),
-                end=CoordinatesSelectorRequest(x=end_x, y=end_y),
-            ),
+        controller = UnifiedMobileController(ctx)
+        output = await controller.swipe_coords(
+            start_x=start_x,
+            start_y=start_y,
+            end_x=end_x,
+            end_y=end_y,
             duration=duration,
         )
-        return await _execute_swipe(tool_call_id, state, agent_thought, swipe_request)
+        return await _swipe_command(tool_call_id, state, agent_thought, output)
 
     @tool
     async def swipe_percentages(
         agent_thought: str,
-        start_x_percent: int = Field(description="Start X percent (0-100)", ge=0, le=100),
-        start_y_percent: int = Field(description="Start Y percent (0-100)", ge=0, le=100),
-        end_x_percent: int = Field(description="End X percent (0-100)", ge=0, le=100),
-        end_y_percent: int = Field(description="End Y percent (0-100)", ge=0, le=100),
-        duration: int = Field(description="Duration in ms", ge=1, le=10000, default=400),
+        start_x_percent: Annotated[int, Field(description="Start X percent (0-100)", ge=0, le=100)],
+        start_y_percent: Annotated[int, Field(description="Start Y percent (0-100)", ge=0, le=100)],
+        end_x_percent: Annotated[int, Field(description="End X percent (0-100)", ge=0, le=100)],
+        end_y_percent: Annotated[int, Field(description="End Y percent (0-100)", ge=0, le=100)],
+        duration: Annotated[int, Field(description="Duration in ms", ge=1, le=10000)] = 400,
         tool_call_id: Annotated[str, InjectedToolCallId] = None,  # type: ignore
         state: Annotated[State, InjectedState] = None,  # type: ignore
     ) -> Command:
         """Swipe using percentage coordinates from start position to end position."""
-        swipe_request = SwipeRequest(
-            swipe_mode=SwipeStartEndPercentagesRequest(
-                start=PercentagesSelectorRequest(
-                    x_percent=start_x_percent, y_percent=start_y_percent
-                ),
-                end=PercentagesSelectorRequest(x_percent=end_x_percent, y_percent=end_y_percent),
-            ),
+        controller = UnifiedMobileController(ctx)
+        output = await controller.swipe_percentage(
+            start_x_percent=start_x_percent,
+            start_y_percent=start_y_percent,
+            end_x_percent=end_x_percent,
+            end_y_percent=end_y_percent,
             duration=duration,
         )
-        return await _execute_swipe(tool_call_id, state, agent_thought, swipe_request)
+        return await _swipe_command(tool_call_id, state, agent_thought, output)
 
     return [swipe_coordinates, swipe_percentages]
 
@@ -1,3 +1,4 @@
+from collections.abc import Awaitable, Callable
 from typing import Annotated
 
 from langchain_core.messages import ToolMessage
@@ -6,8 +7,8 @@ from langchain_core.tools.base import BaseTool, InjectedToolCallId
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 
-from minitap.mobile_use.constants import EXECUTOR_MESSAGES_KEY
 from minitap.mobile_use.context import MobileUseContext
+from minitap.mobile_use.controllers.types import TapOutput
 from minitap.mobile_use.controllers.unified_controller import UnifiedMobileController
 from minitap.mobile_use.graph.state import State
 from minitap.mobile_use.tools.tool_wrapper import ToolWrapper
@@ -15,6 +16,8 @@ from minitap.mobile_use.tools.types import Target
 from minitap.mobile_use.tools.utils import has_valid_selectors, validate_coordinates_bounds
 from minitap.mobile_use.utils.logger import get_logger
 
+# Shared empty kwargs for successful tool messages; ToolMessage copies it on validation
+
 logger = get_logger(__name__)
 
 
@@ -35,7 +38,6 @@ def get_tap_tool(ctx: MobileUseContext) -> BaseTool:
         """
         # Track all attempts for better error reporting
         attempts: list[dict] = []
-        success = False
         successful_selector: str | None = None
 
         # Validate target has at least one selector
@@ -48,76 +50,50 @@ def get_tap_tool(ctx: MobileUseContext) -> BaseTool:
             )
 
         controller = UnifiedMobileController(ctx)
-
-        # 1. Try with COORDINATES FIRST (visual approach)
-        if not success and target.bounds:
-            center = target.bounds.get_center()
-            selector_info = f"coordinates ({center.x}, {center.y})"
-
-            # Validate bounds before attempting
-            bounds_error = validate_coordinates_bounds(
-                target, ctx.device.device_width, ctx.device.device_height
-            )
-            if bounds_error:
-                logger.warning(f"Coordinates out of bounds: {bounds_error}")
-                attempts.append(
-                    {"selector": selector_info, "error": f"Out of bounds: {bounds_error}"}
-                )
-            else:
-                try:
-                    center_point = target.bounds.get_center()
-                    logger.info(f"Attempting tap with {selector_info}")
-                    result = await controller.tap_at(x=center_point.x, y=center_point.y)
-                    if result.error is None:
-                        success = True
-                        successful_selector = selector_info
-                    else:
-                        error_msg = result.error
-                        logger.warning(f"Tap with {selector_info} failed: {error_msg}")
-                        attempts.append({"selector": selector_info, "error": error_msg})
-                except Exception as e:
-                    logger.warning(f"Exception during tap with {selector_info}: {e}")
-                    attempts.append({"selector": selector_info, "error": str(e)})
-
-        # 2. If coordinates failed or weren't provided, try with resource_id
-        if not success and target.resource_id:
-            selector_info = f"resource_id='{target.resource_id}' (index={target.resource_id_index})"
-            try:
-                logger.info(f"Attempting tap with {selector_info}")
-                result = await controller.tap_element(
-                    resource_id=target.resource_id,
-                    index=target.resource_id_index or 0,
+        # Fetched at most once and shared by the element locators
+        ui_hierarchy: list[dict] | None = None
+
+        for locator, describe_selector, tap_with_locator in TAP_FALLBACKS:
+            if not getattr(target, locator):
+                continue
+            selector_info = describe_selector(target)
+
+            if locator == "bounds":
+                # Validate bounds before attempting
+                bounds_error = validate_coordinates_bounds(
+                    target, ctx.device.device_width, ctx.device.device_height
                 )
-                if result.error is None:
-                    success = True
-                    successful_selector = selector_info
-                else:
-                    error_msg = result.error
-                    logger.warning(f"Tap with {selector_info} failed: {error_msg}")
-                    attempts.append({"selector": selector_info, "error": error_msg})
-            except Exception as e:
-                logger.warning(f"Exception during tap with {selector_info}: {e}")
-                attempts.append({"selector": selector_info, "error": str(e)})
+                if bounds_error:
+                    logger.warning(f"Coordinates out of bounds: {bounds_error}")
+                    attempts.append(
+                        {"selector": selector_info, "error": f"Out of bounds: {bounds_error}"}
+                    )
+                    continue
 
-        # 3. If resource_id failed or wasn't provided, try with text (last resort)
-        if not success and target.text:
-            selector_info = f"text='{target.text}' (index={target.text_index})"
             try:
                 logger.info(f"Attempting tap with {selector_info}")
-                result = await controller.tap_element(
-                    text=target.text,
-                    index=target.text_index or 0,
-                )
-                if result.error is None:
-                    success = True
-                    successful_selector = selector_info
-                else:
-                    error_msg = result.error
-                    logger.warning(f"Tap with {selector_info} failed: {error_msg}")
-                    attempts.append({"selector": selector_info, "error": error_msg})
+                if (
+                    locator != "bounds"
+                    and ui_hierarchy is None
+                    and target.resource_id
+                    and target.text
+                ):
+                    # Both element locators resolve against the same screen, so a missed
+                    # resource_id falls back to text without another device round trip
+                    ui_hierarchy = await controller.get_ui_elements()
+                result = await tap_with_locator(controller, target, ui_hierarchy)
             except Exception as e:
                 logger.warning(f"Exception during tap with {selector_info}: {e}")
                 attempts.append({"selector": selector_info, "error": str(e)})
+                continue
+
+            if result.error is None:
+                successful_selector = selector_info
+                break
+            logger.warning(f"Tap with {selector_info} failed: {result.error}")
+            attempts.append({"selector": selector_info, "error": result.error})
+
+        success = successful_selector is not None
 
         # Build result message
         if success:
@@ -134,19 +110,69 @@ def get_tap_tool(ctx: MobileUseContext) -> BaseTool:
             status="success" if success else "error",
         )
         return Command(
-            update=await state.asanitize_update(
-                ctx=ctx,
-                update={
-                    "agents_thoughts": [agent_thought, agent_outcome],
-                    EXECUTOR_MESSAGES_KEY: [tool_message],
-                },
-                agent="executor",
+            update=await state.aexecutor_tool_update(
+                ctx, agent_thought, agent_outcome, tool_message
             ),
         )
 
     return tap
 
 
+def _describe_coordinates(target: Target) -> str:
+    center = target.bounds.get_center()  # type: ignore[union-attr]
+    return f"coordinates ({center.x}, {center.y})"
+
+
+def _describe_resource_id(target: Target) -> str:
+    return f"resource_id='{target.resource_id}' (index={target.resource_id_index})"
+
+
+def _describe_text(target: Target) -> str:
+    return f"text='{target.text}' (index={target.text_index})"
+
+
+async def _tap_coordinates(
+    controller: UnifiedMobileController, target: Target, ui_hierarchy: list[dict] | None
+) -> TapOutput:
+    center = target.bounds.get_center()  # type: ignore[union-attr]
+    return await controller.tap_at(x=center.x, y=center.y)
+
+
+async def _tap_resource_id(
+    controller: UnifiedMobileController, target: Target, ui_hierarchy: list[dict] | None
+) -> TapOutput:
+    return await controller.tap_element(
+        resource_id=target.resource_id,
+        index=target.resource_id_index or 0,
+        ui_hierarchy=ui_hierarchy,
+    )
+
+
+async def _tap_text(
+    controller: UnifiedMobileController, target: Target, ui_hierarchy: list[dict] | None
+) -> TapOutput:
+    return await controller.tap_element(
+        text=target.text,
+        index=target.text_index or 0,
+        ui_hierarchy=ui_hierarchy,
+    )
+
+
+# Locators tried in order until one succeeds: coordinates first (visual approach),
+# then resource_id, then text as a last resort.
+TAP_FALLBACKS: list[
+    tuple[
+        str,
+        Callable[[Target], str],
+        Callable[[UnifiedMobileController, Target, list[dict] | None], Awaitable[TapOutput]],
+    ]
+] = [
+    ("bounds", _describe_coordinates, _tap_coordinates),
+    ("resource_id", _describe_resource_id, _tap_resource_id),
+    ("text", _describe_text, _tap_text),
+]
+
+
 tap_wrapper = ToolWrapper(
     tool_fn_getter=get_tap_tool,
     on_success_fn=lambda selector_info: f"Tap on element with {selector_info} was successful.",
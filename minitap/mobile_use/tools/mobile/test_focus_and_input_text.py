@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from langchain_core.tools import StructuredTool
+
+from minitap.mobile_use.constants import EXECUTOR_MESSAGES_KEY
+from minitap.mobile_use.controllers import unified_controller
+from minitap.mobile_use.tools.mobile import focus_and_input_text
+from minitap.mobile_use.tools.mobile.focus_and_input_text import (
+    InputResult,
+    _controller_input_text,
+    get_focus_and_input_text_tool,
+)
+from minitap.mobile_use.tools.types import Target
+
+
+def test_input_text_drops_cached_ui_hierarchy():
+    ctx = Mock()
+    ctx.device.device_id = "emulator-5554"
+    device_controller = Mock()
+    device_controller.input_text = AsyncMock(return_value=True)
+    unified_controller._ui_hierarchy_cache["emulator-5554"] = (0.0, [{"text": ""}])
+
+    with patch.object(unified_controller, "get_controller", return_value=device_controller):
+        result = asyncio.run(_controller_input_text(ctx=ctx, text="hello"))
+
+    assert result.ok
+    device_controller.input_text.assert_awaited_once_with("hello")
+    assert "emulator-5554" not in unified_controller._ui_hierarchy_cache
+
+
+def _run_tool(target: Target, elements: list[list[dict]]) -> tuple[AsyncMock, dict]:
+    state = Mock()
+    state.asanitize_update = AsyncMock(side_effect=lambda ctx, update, agent: update)
+    device_controller = Mock()
+    device_controller.get_screen_data = AsyncMock(
+        side_effect=[Mock(elements=hierarchy) for hierarchy in elements]
+    )
+    tool = get_focus_and_input_text_tool(Mock())
+    assert isinstance(tool, StructuredTool) and tool.coroutine is not None
+    tool_coroutine = tool.coroutine
+
+    async def run_tool():
+        return await tool_coroutine(
+            agent_thought="", text="hello", target=target, tool_call_id="call", state=state
+        )
+
+    with (
+        patch.object(
+            focus_and_input_text, "focus_element_if_needed", AsyncMock(return_value="resource_id")
+        ),
+        patch.object(focus_and_input_text, "recover_focus", AsyncMock(return_value="coordinates")),
+        patch.object(focus_and_input_text, "move_cursor_to_end_if_bounds", AsyncMock()),
+        patch.object(
+            focus_and_input_text,
+            "_controller_input_text",
+            AsyncMock(return_value=InputResult(ok=True)),
+        ) as input_text,
+        patch.object(
+            focus_and_input_text, "create_device_controller", return_value=device_controller
+        ),
+    ):
+        command = asyncio.run(run_tool())
+    assert isinstance(command.update, dict)
+    return input_text, command.update
+
+
+def _target() -> Target:
+    return Target(
+        resource_id="com.example:id/input",
+        resource_id_index=None,
+        text=None,
+        text_index=None,
+        bounds=None,
+    )
+
+
+def test_input_is_retried_when_the_trusted_focus_did_not_take():
+    unfocused = [{"resourceId": "com.example:id/input", "text": "", "focused": "false"}]
+    focused = [{"resourceId": "com.example:id/input", "text": "hello", "focused": "true"}]
+
+    input_text, update = _run_tool(_target(), [unfocused, focused])
+
+    assert input_text.await_count == 2
+    message = update[EXECUTOR_MESSAGES_KEY][0]
+    assert message.status == "success"
+    assert "using coordinates" in message.content
+
+
+def test_input_is_not_retried_when_the_element_is_focused():
+    focused = [{"resourceId": "com.example:id/input", "text": "hello", "focused": "true"}]
+
+    input_text, update = _run_tool(_target(), [focused])
+
+    assert input_text.await_count == 1
+    assert "'hello'" in update[EXECUTOR_MESSAGES_KEY][0].content
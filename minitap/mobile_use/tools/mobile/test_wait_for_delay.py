@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from langchain_core.messages import AIMessage
+
+from minitap.mobile_use.tools.mobile.wait_for_delay import get_wait_for_delay_tool
+
+
+def _state(tool_calls: list[dict]) -> Mock:
+    state = Mock()
+    state.executor_messages = [AIMessage(content="", tool_calls=tool_calls)]
+    state.asanitize_update = AsyncMock(side_effect=lambda ctx, update, agent: update)
+    return state
+
+
+def _call(call_id: str, name: str = "wait_for_delay", time_in_ms: int = 1000) -> dict:
+    return {"id": call_id, "name": name, "args": {"agent_thought": "", "time_in_ms": time_in_ms}}
+
+
+def _run(tool, state: Mock, call: dict) -> None:
+    asyncio.run(tool.coroutine(**call["args"], tool_call_id=call["id"], state=state))
+
+
+def test_identical_back_to_back_wait_is_skipped():
+    calls = [_call("first"), _call("second")]
+    state = _state(calls)
+    tool = get_wait_for_delay_tool(Mock())
+
+    with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+        _run(tool, state, calls[0])
+        _run(tool, state, calls[1])
+
+    sleep.assert_awaited_once_with(1)
+
+
+def test_wait_is_not_skipped_after_another_action_or_in_a_new_batch():
+    tool = get_wait_for_delay_tool(Mock())
+    batch = [_call("first"), _call("tap", name="tap"), _call("second")]
+    next_batch = [_call("third")]
+
+    with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+        _run(tool, _state(batch), batch[0])
+        _run(tool, _state(batch), batch[2])
+        _run(tool, _state(next_batch), next_batch[0])
+
+    assert sleep.await_count == 3
+
+
+def test_recent_waits_are_not_shared_between_devices():
+    calls = [_call("first"), _call("second")]
+    state = _state(calls)
+
+    with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+        _run(get_wait_for_delay_tool(Mock()), state, calls[0])
+        _run(get_wait_for_delay_tool(Mock()), state, calls[1])
+
+    assert sleep.await_count == 2
@@ -1,7 +1,7 @@
-import time
+import asyncio
 from typing import Annotated
 
-from langchain_core.messages import ToolMessage
+from langchain_core.messages import AIMessage, ToolMessage
 from langchain_core.tools import tool
 from langchain_core.tools.base import InjectedToolCallId
 from langgraph.prebuilt import InjectedState
@@ -10,12 +10,29 @@ from langgraph.types import Command
 from minitap.mobile_use.constants import EXECUTOR_MESSAGES_KEY
 from minitap.mobile_use.context import MobileUseContext
 from minitap.mobile_use.graph.state import State
+from minitap.mobile_use.tools.cache import TTLCache
 from minitap.mobile_use.tools.tool_wrapper import ToolWrapper
 
 MAX_DELAY_MS = 60000
 
 
+def _previous_tool_call(state: State, tool_call_id: str) -> dict | None:
+    """Returns the tool call issued right before this one in the current executor batch."""
+    for message in reversed(state.executor_messages):
+        if isinstance(message, AIMessage):
+            ids = [call["id"] for call in message.tool_calls]
+            if tool_call_id in ids and ids.index(tool_call_id) > 0:
+                return dict(message.tool_calls[ids.index(tool_call_id) - 1])
+            return None
+    return None
+
+
 def get_wait_for_delay_tool(ctx: MobileUseContext):
+    # Waits completed recently on this device, keyed by their tool call. A wait issued right
+    # after an identical one of the same executor batch - nothing ran and nothing was observed
+    # in between - is skipped while the previous one is still fresh.
+    recent_waits = TTLCache(maxsize=64)
+
     @tool
     async def wait_for_delay(
         agent_thought: str,
@@ -42,8 +59,15 @@ def get_wait_for_delay_tool(ctx: MobileUseContext):
             time_in_ms = 1000
         if time_in_ms > MAX_DELAY_MS:
             time_in_ms = MAX_DELAY_MS
+        previous_call = _previous_tool_call(state, tool_call_id)
         try:
-            time.sleep(time_in_ms / 1000)
+            if (
+                previous_call is None
+                or previous_call["name"] != "wait_for_delay"
+                or recent_waits.get((previous_call["id"], time_in_ms)) is None
+            ):
+                await asyncio.sleep(time_in_ms / 1000)
+            recent_waits.set((tool_call_id, time_in_ms), True, ttl_seconds=time_in_ms / 1000)
             output = None
             has_failed = False
         except Exception as e:
@@ -0,0 +1,25 @@
+from unittest.mock import patch
+
+from minitap.mobile_use.tools.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache()
+    with patch("minitap.mobile_use.tools.cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value", ttl_seconds=2)
+        assert cache.get("key") == "value"
+    with patch("minitap.mobile_use.tools.cache.time.monotonic", return_value=102.0):
+        assert cache.get("key") is None
+    assert cache.get("missing") is None
+
+
+def test_ttl_cache_evicts_oldest_entry_when_full():
+    cache = TTLCache(maxsize=2)
+    cache.set("first", 1, ttl_seconds=60)
+    cache.set("second", 2, ttl_seconds=60)
+    cache.set("first", 1, ttl_seconds=60)
+    cache.set("third", 3, ttl_seconds=60)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
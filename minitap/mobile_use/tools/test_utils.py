@@ -9,16 +9,27 @@ sys.modules["langgraph.prebuilt.chat_agent_executor"] = Mock()
 sys.modules["minitap.mobile_use.graph.state"] = Mock()
 
 from minitap.mobile_use.context import DeviceContext, DevicePlatform, MobileUseContext  # noqa: E402
+from minitap.mobile_use.controllers import unified_controller  # noqa: E402
+from minitap.mobile_use.controllers.types import TapOutput  # noqa: E402
 from minitap.mobile_use.tools.types import Target  # noqa: E402
 from minitap.mobile_use.tools.utils import (  # noqa: E402
     IdSelectorRequest,
     SelectorRequestWithCoordinates,
     focus_element_if_needed,
+    has_valid_selectors,
     move_cursor_to_end_if_bounds,
+    recover_focus,
+    validate_coordinates_bounds,
 )
 from minitap.mobile_use.utils.ui_hierarchy import ElementBounds  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def clear_ui_hierarchy_cache():
+    """Prevent hierarchies fetched by one test from being reused by the next one."""
+    unified_controller._ui_hierarchy_cache.clear()
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock MobileUseContext for testing."""
@@ -266,6 +277,30 @@ class TestFocusElementIfNeeded:
         assert result == "resource_id"
         mock_context.ui_adb_client.get_screen_data.assert_called_once()
 
+    @patch("minitap.mobile_use.tools.utils.tap")
+    @patch("minitap.mobile_use.tools.utils.find_element_by_resource_id")
+    def test_focus_element_needs_focus_trusts_successful_tap(
+        self, mock_find_element, mock_tap, mock_context, sample_rich_element
+    ):
+        """Test that a successful focusing tap is trusted without re-fetching the hierarchy."""
+        mock_find_element.return_value = sample_rich_element["attributes"]
+        mock_tap.return_value = TapOutput()
+
+        target = Target(
+            resource_id="com.example:id/text_input",
+            resource_id_index=None,
+            text=None,
+            text_index=None,
+            bounds=None,
+        )
+        result = asyncio.run(focus_element_if_needed(ctx=mock_context, target=target))
+
+        mock_tap.assert_called_once()
+        mock_find_element.assert_called_once()
+        assert mock_context.ui_adb_client.get_screen_data.call_count == 1
+        assert result == "resource_id"
+
+    @patch("minitap.mobile_use.tools.utils.VERIFY_FOCUS", True)
     @patch("minitap.mobile_use.tools.utils.tap")
     @patch("minitap.mobile_use.tools.utils.find_element_by_resource_id")
     def test_focus_element_needs_focus_success(
@@ -303,6 +338,28 @@ class TestFocusElementIfNeeded:
         assert mock_context.ui_adb_client.get_screen_data.call_count == 2
         assert result == "resource_id"
 
+    @patch("minitap.mobile_use.tools.utils.tap")
+    @patch("minitap.mobile_use.tools.utils.find_element_by_resource_id")
+    def test_recover_focus_verifies_and_falls_back_to_coordinates(
+        self, mock_find_element, mock_tap, mock_context, sample_rich_element
+    ):
+        """Test that recovering focus checks the tap result instead of trusting it."""
+        mock_find_element.return_value = sample_rich_element["attributes"]
+        mock_tap.return_value = TapOutput()
+
+        target = Target(
+            resource_id="com.example:id/text_input",
+            resource_id_index=None,
+            text=None,
+            text_index=None,
+            bounds=ElementBounds(x=100, y=200, width=50, height=20),
+        )
+        result = asyncio.run(recover_focus(ctx=mock_context, target=target))
+
+        assert mock_context.ui_adb_client.get_screen_data.call_count == 2
+        assert mock_tap.call_count == 2
+        assert result == "coordinates"
+
     @patch("minitap.mobile_use.tools.utils.tap")
     @patch("minitap.mobile_use.tools.utils.logger")
     @patch("minitap.mobile_use.tools.utils.find_element_by_resource_id")
@@ -409,5 +466,36 @@ class TestFocusElementIfNeeded:
         assert result is None
 
 
+class TestTargetValidation:
+    """Test target selector and bounds validation."""
+
+    @staticmethod
+    def _target(resource_id=None, text=None, bounds=None) -> Target:
+        return Target(
+            resource_id=resource_id,
+            resource_id_index=None,
+            text=text,
+            text_index=None,
+            bounds=bounds,
+        )
+
+    def test_has_valid_selectors_ignores_empty_strings(self):
+        assert not has_valid_selectors(self._target(resource_id="", text=""))
+        assert has_valid_selectors(self._target(text="Login"))
+        assert has_valid_selectors(
+            self._target(bounds=ElementBounds(x=0, y=0, width=10, height=10))
+        )
+
+    def test_validate_coordinates_bounds(self):
+        inside = self._target(bounds=ElementBounds(x=0, y=0, width=100, height=100))
+        outside = self._target(bounds=ElementBounds(x=1000, y=-100, width=200, height=50))
+
+        assert validate_coordinates_bounds(self._target(), 1080, 2340) is None
+        assert validate_coordinates_bounds(inside, 1080, 2340) is None
+        assert validate_coordinates_bounds(outside, 1080, 2340) == (
+            "x=1100 is outside screen width (0-1080); y=-75 is outside screen height (0-2340)"
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,16 +1,18 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel
 
 from minitap.mobile_use.context import MobileUseContext
 
 
-class ToolWrapper(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ToolWrapper:
     tool_fn_getter: Callable[[MobileUseContext], BaseTool]
     on_success_fn: Callable[..., str]
     on_failure_fn: Callable[..., str]
 
 
+@dataclass(slots=True, frozen=True)
 class CompositeToolWrapper(ToolWrapper):
     composite_tools_fn_getter: Callable[[MobileUseContext], list[BaseTool]]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict
@@ -8,6 +9,7 @@ from minitap.mobile_use.context import MobileUseContext
 from minitap.mobile_use.controllers.types import (
     CoordinatesSelectorRequest,
     PercentagesSelectorRequest,
+    TapOutput,
 )
 from minitap.mobile_use.controllers.unified_controller import UnifiedMobileController
 from minitap.mobile_use.graph.state import State
@@ -19,11 +21,15 @@ from minitap.mobile_use.utils.ui_hierarchy import (
     find_element_by_resource_id,
     get_bounds_for_element,
     get_element_text,
+    index_ui_hierarchy,
     is_element_focused,
 )
 
 logger = get_logger(__name__)
 
+# Re-fetch the hierarchy after a focusing tap to check that the element actually got focus
+VERIFY_FOCUS = os.environ.get("MOBILE_USE_VERIFY_FOCUS", "").lower() in ("1", "true", "yes")
+
 
 def find_element_by_text(
     ui_hierarchy: list[dict], text: str, index: int | None = None
@@ -31,7 +37,8 @@ def find_element_by_text(
     """
     Find a UI element by its text content (adapted to both flat and rich hierarchy)
 
-    This function performs a recursive, case-insensitive partial search.
+    This function performs a case-insensitive exact match, looked up in the index of the
+    hierarchy (built once per hierarchy object).
 
     Args:
         ui_hierarchy: List of UI element dictionaries.
@@ -40,28 +47,9 @@ def find_element_by_text(
     Returns:
         The complete UI element dictionary if found, None otherwise.
     """
-
-    def search_recursive(elements: list[dict]) -> dict | None:
-        for element in elements:
-            if isinstance(element, dict):
-                src = element.get("attributes", element)
-                element_text = src.get("text", "")
-                # Guard against non-string text values (e.g., dict)
-                if not isinstance(element_text, str):
-                    element_text = ""
-                if text and text.lower() == element_text.lower():
-                    idx = index or 0
-                    if idx == 0:
-                        return element
-                    idx -= 1
-                    continue
-                if (children := element.get("children", [])) and (
-                    found := search_recursive(children)
-                ):
-                    return found
+    if not text:
         return None
-
-    return search_recursive(ui_hierarchy)
+    return index_ui_hierarchy(ui_hierarchy).find_by_text(text, index)
 
 
 async def tap_bottom_right_of_element(bounds: ElementBounds, ctx: MobileUseContext):
@@ -103,7 +91,7 @@ async def move_cursor_to_end_if_bounds(
 
         logger.debug("Tapping near the end of the input to move the cursor")
         await tap_bottom_right_of_element(bounds=bounds, ctx=ctx)
-        logger.debug(f"Tapped end of input {target.resource_id}")
+        logger.debug("Tapped end of input %s", target.resource_id)
         return elt
 
     if target.bounds:
@@ -119,7 +107,7 @@ async def move_cursor_to_end_if_bounds(
             bounds = get_bounds_for_element(text_elt)
             if bounds:
                 await tap_bottom_right_of_element(bounds=bounds, ctx=ctx)
-                logger.debug(f"Tapped end of input that had text'{target.text}'")
+                logger.debug("Tapped end of input that had text'%s'", target.text)
                 return text_elt
         return None
 
@@ -127,10 +115,14 @@ async def move_cursor_to_end_if_bounds(
 
 
 async def focus_element_if_needed(
-    ctx: MobileUseContext, target: Target
+    ctx: MobileUseContext, target: Target, verify: bool = False
 ) -> Literal["resource_id", "coordinates", "text"] | None:
     """
     Ensures the element is focused, with a sanity check to prevent trusting misleading IDs.
+
+    Unless `verify` (or VERIFY_FOCUS) is set, a resource_id tap that reports no error is
+    trusted without fetching the hierarchy again. Callers that later find the element
+    unfocused use recover_focus.
     """
     controller = UnifiedMobileController(ctx)
     rich_hierarchy = await controller.get_ui_elements()
@@ -154,13 +146,16 @@ async def focus_element_if_needed(
 
     if elt_from_id:
         if not is_element_focused(elt_from_id):
-            tap(
+            tap_result = await tap(
                 ctx=ctx,
                 selector_request=IdSelectorRequest(id=target.resource_id),  # type: ignore
                 index=target.resource_id_index,
             )
-            logger.debug(f"Focused (tap) on resource_id={target.resource_id}")
-            rich_hierarchy = await controller.get_ui_elements()
+            logger.debug("Focused (tap) on resource_id=%s", target.resource_id)
+            trusted = not (verify or VERIFY_FOCUS)
+            if trusted and isinstance(tap_result, TapOutput) and tap_result.error is None:
+                return "resource_id"
+            rich_hierarchy = await controller.get_ui_elements(use_cache=False)
             elt_from_id = find_element_by_resource_id(
                 ui_hierarchy=rich_hierarchy,
                 resource_id=target.resource_id,  # type: ignore
@@ -168,7 +163,7 @@ async def focus_element_if_needed(
                 is_rich_hierarchy=False,
             )
         if elt_from_id and is_element_focused(elt_from_id):
-            logger.debug(f"Text input is focused: {target.resource_id}")
+            logger.debug("Text input is focused: %s", target.resource_id)
             return "resource_id"
         logger.warning(f"Failed to focus using resource_id='{target.resource_id}'. Fallback...")
 
@@ -180,7 +175,7 @@ async def focus_element_if_needed(
                 coordinates=CoordinatesSelectorRequest(x=relative_point.x, y=relative_point.y)
             ),
         )
-        logger.debug(f"Tapped on coordinates ({relative_point.x}, {relative_point.y}) to focus.")
+        logger.debug("Tapped on coordinates (%s, %s) to focus.", relative_point.x, relative_point.y)
         return "coordinates"
 
     if target.text:
@@ -197,7 +192,7 @@ async def focus_element_if_needed(
                         )
                     ),
                 )
-                logger.debug(f"Tapped on text element '{target.text}' to focus.")
+                logger.debug("Tapped on text element '%s' to focus.", target.text)
                 return "text"
 
     logger.error(
@@ -206,6 +201,16 @@ async def focus_element_if_needed(
     return None
 
 
+async def recover_focus(
+    ctx: MobileUseContext, target: Target
+) -> Literal["resource_id", "coordinates", "text"] | None:
+    """
+    Focuses the element again after a trusted resource_id tap did not give it focus, this time
+    checking the focus and falling back to the coordinates and text locators.
+    """
+    return await focus_element_if_needed(ctx=ctx, target=target, verify=True)
+
+
 def validate_coordinates_bounds(
     target: Target, screen_width: int, screen_height: int
 ) -> str | None:
@@ -217,22 +222,21 @@ def validate_coordinates_bounds(
         return None
 
     center = target.bounds.get_center()
-    errors = []
-
-    if center.x < 0 or center.x >= screen_width:
-        errors.append(f"x={center.x} is outside screen width (0-{screen_width})")
-    if center.y < 0 or center.y >= screen_height:
-        errors.append(f"y={center.y} is outside screen height (0-{screen_height})")
+    x, y = center.x, center.y
+    if 0 <= x < screen_width and 0 <= y < screen_height:
+        return None
 
-    return "; ".join(errors) if errors else None
+    errors = []
+    if not 0 <= x < screen_width:
+        errors.append(f"x={x} is outside screen width (0-{screen_width})")
+    if not 0 <= y < screen_height:
+        errors.append(f"y={y} is outside screen height (0-{screen_height})")
+    return "; ".join(errors)
 
 
 def has_valid_selectors(target: Target) -> bool:
     """Check if target has at least one valid selector."""
-    has_coordinates = target.bounds is not None
-    has_resource_id = target.resource_id is not None and target.resource_id != ""
-    has_text = target.text is not None and target.text != ""
-    return has_coordinates or has_resource_id or has_text
+    return bool(target.bounds or target.resource_id or target.text)
 
 
 class IdSelectorRequest(BaseModel):
@@ -1,5 +1,6 @@
 import logging
 import sys
+from collections.abc import Callable
 from enum import Enum
 from pathlib import Path
 
@@ -37,8 +38,11 @@ class MobileUseLogger:
             enable_file_logging: Whether to enable file logging
         """
         self.name = name
+        self.console_level = console_level
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
+        # Records below every handler level are dropped before any message formatting
+        handler_levels = [console_level] + ([file_level] if enable_file_logging else [])
+        self.logger.setLevel(min(getattr(logging, level.upper()) for level in handler_levels))
 
         self.logger.handlers.clear()
 
@@ -48,13 +52,16 @@ class MobileUseLogger:
             self._setup_file_handler(log_file, file_level)
 
     def _setup_console_handler(self, level: str):
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = _console_handler_factory()
         console_handler.setLevel(getattr(logging, level.upper()))
 
         console_formatter = ColoredFormatter()
         console_handler.setFormatter(console_formatter)
 
         self.logger.addHandler(console_handler)
+        self._console_handler = console_handler
+        # Console output routed elsewhere must not also reach the handlers of the root logger
+        self.logger.propagate = _console_handler_factory is _stdout_handler
 
     def _setup_file_handler(self, log_file: str | Path | None, level: str):
         if log_file is None:
@@ -73,23 +80,23 @@ class MobileUseLogger:
 
         self.logger.addHandler(file_handler)
 
-    def debug(self, message: str, **kwargs):
-        self.logger.debug(message, extra={"log_level": LogLevel.DEBUG}, **kwargs)
+    def debug(self, message: str, *args, **kwargs):
+        self.logger.debug(message, *args, extra={"log_level": LogLevel.DEBUG}, **kwargs)
 
-    def info(self, message: str, **kwargs):
-        self.logger.info(message, extra={"log_level": LogLevel.INFO}, **kwargs)
+    def info(self, message: str, *args, **kwargs):
+        self.logger.info(message, *args, extra={"log_level": LogLevel.INFO}, **kwargs)
 
-    def success(self, message: str, **kwargs):
-        self.logger.info(message, extra={"log_level": LogLevel.SUCCESS}, **kwargs)
+    def success(self, message: str, *args, **kwargs):
+        self.logger.info(message, *args, extra={"log_level": LogLevel.SUCCESS}, **kwargs)
 
-    def warning(self, message: str, **kwargs):
-        self.logger.warning(message, extra={"log_level": LogLevel.WARNING}, **kwargs)
+    def warning(self, message: str, *args, **kwargs):
+        self.logger.warning(message, *args, extra={"log_level": LogLevel.WARNING}, **kwargs)
 
-    def error(self, message: str, **kwargs):
-        self.logger.error(message, extra={"log_level": LogLevel.ERROR}, **kwargs)
+    def error(self, message: str, *args, **kwargs):
+        self.logger.error(message, *args, extra={"log_level": LogLevel.ERROR}, **kwargs)
 
-    def critical(self, message: str, **kwargs):
-        self.logger.critical(message, extra={"log_level": LogLevel.CRITICAL}, **kwargs)
+    def critical(self, message: str, *args, **kwargs):
+        self.logger.critical(message, *args, extra={"log_level": LogLevel.CRITICAL}, **kwargs)
 
     def header(self, message: str, **_kwargs):
         separator = "=" * 60
@@ -115,6 +122,26 @@ class ColoredFormatter(logging.Formatter):
 _loggers = {}
 
 
+def _stdout_handler() -> logging.Handler:
+    return logging.StreamHandler(sys.stdout)
+
+
+_console_handler_factory: Callable[[], logging.Handler] = _stdout_handler
+
+
+def route_console_output(handler_factory: Callable[[], logging.Handler]):
+    """
+    Sends the console output of every logger, existing and future, to a handler built by
+    handler_factory instead of writing to stdout, e.g. a QueueHandler so that the write
+    happens off the calling thread.
+    """
+    global _console_handler_factory
+    _console_handler_factory = handler_factory
+    for mobile_use_logger in _loggers.values():
+        mobile_use_logger.logger.removeHandler(mobile_use_logger._console_handler)
+        mobile_use_logger._setup_console_handler(mobile_use_logger.console_level)
+
+
 def get_logger(
     name: str,
     log_file: str | Path | None = None,
@@ -1,7 +1,9 @@
+import base64
 import json
 import os
 import subprocess
 import tempfile
+from io import BytesIO
 from pathlib import Path
 
 from PIL import Image
@@ -139,6 +141,22 @@ def _save_gif_ffmpeg(
             palette_path.unlink()
 
 
+def save_base64_image_as_jpeg(image_base64: str, output_path: Path, quality: int = 50) -> None:
+    """
+    Decode a base64 image (optionally a data URL) and save it as a compressed JPEG file.
+
+    The image is decoded from base64 once and encoded straight to the file, without
+    re-encoding the compressed image to base64 in between.
+    """
+    if image_base64.startswith("data:image"):
+        image_base64 = image_base64.split(",")[1]
+
+    with Image.open(BytesIO(base64.b64decode(image_base64))) as image:
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(output_path, format="JPEG", quality=quality, optimize=True)
+
+
 def create_gif_from_trace_folder(trace_folder_path: Path):
     image_files: list[Path] = []
 
@@ -1,52 +1,97 @@
-import base64
+import asyncio
+import atexit
+import os
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 
 from colorama import Fore, Style
 from langchain_core.messages import BaseMessage
+from pydantic_core import to_json
 
 from minitap.mobile_use.context import MobileUseContext
 from minitap.mobile_use.controllers.controller_factory import create_device_controller
 from minitap.mobile_use.utils.logger import get_logger
+from minitap.mobile_use.utils.media import save_base64_image_as_jpeg
 
 logger = get_logger(__name__)
 
+# Recordings are compressed and written in the background, off the agent loop, by a single
+# worker so that files are written in the order interactions were recorded.
+# Beyond MAX_PENDING_RECORDINGS queued writes, recording waits for the oldest one to finish.
+MAX_PENDING_RECORDINGS = 16
+_recording_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-recorder")
+_pending_recordings: deque[Future] = deque()
+atexit.register(_recording_executor.shutdown, wait=True)
+# Trace folders already created by the worker, so that each one is only created once
+_created_folders: set[Path] = set()
+
 
 async def record_interaction(ctx: MobileUseContext, response: BaseMessage):
     if not ctx.execution_setup:
         raise ValueError("No execution setup found")
-    if not ctx.execution_setup.traces_path or not ctx.execution_setup.trace_name:
+    folder = ctx.execution_setup.trace_folder
+    if folder is None:
         raise ValueError("No traces path or trace name found")
 
     logger.info("Recording interaction")
     controller = create_device_controller(ctx)
     screenshot_base64 = await controller.screenshot()
     logger.info("Screenshot taken")
+    timestamp = time.time()
+
+    while _pending_recordings and _pending_recordings[0].done():
+        _pending_recordings.popleft()
+    if len(_pending_recordings) >= MAX_PENDING_RECORDINGS:
+        await asyncio.wrap_future(_pending_recordings.popleft())
+    _pending_recordings.append(
+        _recording_executor.submit(
+            _write_interaction,
+            folder,
+            int(timestamp),
+            screenshot_base64,
+            to_json(response),
+        )
+    )
+    return "Screenshot recording scheduled"
+
+
+async def flush_recordings() -> None:
+    """Waits for all the scheduled recordings to be written."""
+    while _pending_recordings:
+        await asyncio.wrap_future(_pending_recordings.popleft())
+
+
+def _write_interaction(
+    folder: Path, timestamp: int, screenshot_base64: str, response_json: bytes
+) -> None:
+    # Files are written under a temporary name and renamed once complete, so that an
+    # interrupted run never leaves a truncated screenshot or response in the trace.
+    if folder not in _created_folders:
+        folder.mkdir(parents=True, exist_ok=True)
+        _created_folders.add(folder)
+    screenshot_path = folder.joinpath(f"{timestamp}.jpeg")
+    tmp_path = screenshot_path.with_suffix(".jpeg.tmp")
     try:
-        controller = create_device_controller(ctx)
-        compressed_screenshot_base64 = controller.get_compressed_b64_screenshot(screenshot_base64)
+        save_base64_image_as_jpeg(screenshot_base64, tmp_path)
+        os.replace(tmp_path, screenshot_path)
     except Exception as e:
         logger.error(f"Error compressing screenshot: {e}")
-        return "Could not record this interaction"
-    timestamp = time.time()
-    folder = ctx.execution_setup.traces_path.joinpath(ctx.execution_setup.trace_name).resolve()
-    folder.mkdir(parents=True, exist_ok=True)
+        tmp_path.unlink(missing_ok=True)
+        return
+    response_path = folder.joinpath(f"{timestamp}.json")
+    tmp_path = response_path.with_suffix(".json.tmp")
     try:
-        with open(
-            folder.joinpath(f"{int(timestamp)}.jpeg").resolve(),
-            "wb",
-        ) as f:
-            f.write(base64.b64decode(compressed_screenshot_base64))
-
-        with open(
-            folder.joinpath(f"{int(timestamp)}.json").resolve(),
-            "w",
-            encoding="utf-8",
-        ) as f:
-            f.write(response.model_dump_json())
+        tmp_path.write_bytes(response_json)
+        os.replace(tmp_path, response_path)
     except Exception as e:
         logger.error(f"Error recording interaction: {e}")
-    return "Screenshot recorded successfully"
+        tmp_path.unlink(missing_ok=True)
+
+
+_AGENT_THOUGHT_FORMAT = f"💭 {Fore.LIGHTMAGENTA_EX}%s{Style.RESET_ALL}"
 
 
 def log_agent_thought(agent_thought: str):
-    logger.info(f"💭 {Fore.LIGHTMAGENTA_EX}{agent_thought}{Style.RESET_ALL}")
+    logger.info(_AGENT_THOUGHT_FORMAT, agent_thought)
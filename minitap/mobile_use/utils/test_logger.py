@@ -0,0 +1,28 @@
+import logging
+import queue
+from logging.handlers import QueueHandler
+
+from minitap.mobile_use.utils import logger as logger_module
+from minitap.mobile_use.utils.logger import get_logger, route_console_output
+
+
+def test_route_console_output_sends_records_to_the_queue_only(monkeypatch):
+    monkeypatch.setattr(logger_module, "_loggers", {})
+    monkeypatch.setattr(logger_module, "_console_handler_factory", logger_module._stdout_handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    early = get_logger("minitap.test_logger.early")
+
+    route_console_output(lambda: QueueHandler(log_queue))
+    late = get_logger("minitap.test_logger.late")
+    early.info("hello from mobile-use")
+    late.success("hello again")
+
+    messages = [log_queue.get_nowait().getMessage() for _ in range(log_queue.qsize())]
+    assert len(messages) == 2
+    assert "ℹ hello from mobile-use" in messages[0]
+    assert "✓ hello again" in messages[1]
+    for mobile_use_logger in (early, late):
+        assert not mobile_use_logger.logger.propagate
+        assert not any(
+            type(handler) is logging.StreamHandler for handler in mobile_use_logger.logger.handlers
+        )
@@ -0,0 +1,55 @@
+import asyncio
+import base64
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+from langchain_core.messages import AIMessage
+from PIL import Image
+
+from minitap.mobile_use.utils import recorder
+from minitap.mobile_use.utils.recorder import flush_recordings, record_interaction
+
+
+def _screenshot_base64() -> str:
+    buffer = BytesIO()
+    Image.new("RGB", (4, 4), color="white").save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+async def _record(folder: Path, screenshot_base64: str) -> None:
+    ctx = Mock()
+    ctx.execution_setup.trace_folder = folder
+    controller = Mock()
+    controller.screenshot = AsyncMock(return_value=screenshot_base64)
+    with (
+        patch.object(recorder, "create_device_controller", return_value=controller),
+        patch.object(recorder.time, "time", return_value=1700000000.5),
+    ):
+        await record_interaction(ctx, response=AIMessage(content="thought"))
+    await flush_recordings()
+
+
+def test_record_interaction_writes_screenshot_and_response(tmp_path: Path):
+    folder = tmp_path / "trace"
+
+    asyncio.run(_record(folder, _screenshot_base64()))
+
+    assert sorted(path.name for path in folder.iterdir()) == [
+        "1700000000.jpeg",
+        "1700000000.json",
+    ]
+    assert b"thought" in (folder / "1700000000.json").read_bytes()
+
+
+def test_failed_recording_leaves_no_temporary_file(tmp_path: Path):
+    folder = tmp_path / "trace"
+
+    def save_truncated_jpeg(_screenshot_base64: str, path: Path) -> None:
+        path.write_bytes(b"\xff\xd8")
+        raise OSError("No space left on device")
+
+    with patch.object(recorder, "save_base64_image_as_jpeg", side_effect=save_truncated_jpeg):
+        asyncio.run(_record(folder, _screenshot_base64()))
+
+    assert list(folder.iterdir()) == []
@@ -2,10 +2,12 @@ from unittest.mock import patch
 
 from minitap.mobile_use.utils.ui_hierarchy import (
     ElementBounds,
+    HierarchyIndex,
     Point,
     find_element_by_resource_id,
     get_bounds_for_element,
     get_element_text,
+    index_ui_hierarchy,
     is_element_focused,
     text_input_is_empty,
 )
@@ -53,6 +55,94 @@ def test_find_element_by_resource_id():
     assert result is None
 
 
+def test_find_element_by_resource_id_with_index():
+    ui_hierarchy = [
+        {"resourceId": "com.example:id/item", "text": "First", "children": []},
+        {
+            "resourceId": "com.example:id/list",
+            "children": [{"resourceId": "com.example:id/item", "text": "Second", "children": []}],
+        },
+        {"resourceId": "com.example:id/item", "text": "Third", "children": []},
+    ]
+
+    assert (
+        find_element_by_resource_id(ui_hierarchy, "com.example:id/item", index=1)
+        == (ui_hierarchy[1]["children"][0])
+    )
+    assert (
+        find_element_by_resource_id(ui_hierarchy, "com.example:id/item", index=2)
+        == (ui_hierarchy[2])
+    )
+    assert find_element_by_resource_id(ui_hierarchy, "com.example:id/item", index=3) is None
+
+
+def test_index_ui_hierarchy():
+    ui_hierarchy = [
+        {"attributes": {"text": "Settings"}, "children": [{"text": "Wi-Fi", "children": []}]},
+        {"text": {"unexpected": "value"}, "children": []},
+    ]
+
+    index = index_ui_hierarchy(ui_hierarchy)
+    assert index_ui_hierarchy(ui_hierarchy) is index
+    assert index_ui_hierarchy(list(ui_hierarchy)) is not index
+
+    assert index.find_by_text("settings") is ui_hierarchy[0]
+    assert index.find_by_text("WI-FI") is ui_hierarchy[0]["children"][0]
+    assert index.find_by_text("Wi-Fi", index=1) is None
+
+
+def test_index_ui_hierarchy_deeper_than_recursion_limit():
+    node = {"text": "Leaf", "children": []}
+    for depth in range(2000):
+        node = {"resourceId": f"com.example:id/level_{depth}", "children": [node]}
+
+    index = index_ui_hierarchy([node])
+
+    assert len(index.elements) == 2001
+    assert index.find_by_text("leaf") == {"text": "Leaf", "children": []}
+    assert index.find_by_resource_id("com.example:id/level_0") is index.elements[-2]
+
+
+def _android_hierarchy() -> list[dict]:
+    return [
+        {"resource-id": "com.example:id/title", "text": "Settings"},
+        {"resource-id": "com.example:id/item", "text": "Wi-Fi", "bounds": "[0,100][100,200]"},
+        {"resource-id": "com.example:id/item", "text": "Bluetooth"},
+        {"text": "Search", "accessibilityText": "Search"},
+        {"accessibilityText": "Wi-Fi"},
+    ]
+
+
+def test_hierarchy_index_with_selector_keys():
+    index = HierarchyIndex.build(
+        _android_hierarchy(), id_key="resource-id", text_keys=("text", "accessibilityText")
+    )
+
+    assert index.by_resource_id("com.example:id/item") == [1, 2]
+    assert index.by_resource_id("com.example:id/missing") == []
+    assert index.by_text("Wi-Fi") == [1, 4]
+    assert index.by_text("wi-fi") == []
+    # An element exposing the same text under two keys is only indexed once
+    assert index.by_text("Search") == [3]
+    assert index.matches(resource_id="com.example:id/title", text="Wi-Fi") == [0, 1, 4]
+    assert index.matches() == []
+
+
+def test_index_ui_hierarchy_cache_is_keyed_on_selector_keys():
+    ui_hierarchy = _android_hierarchy()
+
+    text_only = index_ui_hierarchy(ui_hierarchy, id_key="resource-id", text_keys=("text",))
+    with_accessibility = index_ui_hierarchy(
+        ui_hierarchy, id_key="resource-id", text_keys=("text", "accessibilityText")
+    )
+    again = index_ui_hierarchy(ui_hierarchy, id_key="resource-id", text_keys=("text",))
+
+    assert again is text_only
+    assert text_only.by_text("Wi-Fi") == [1]
+    assert with_accessibility.by_text("Wi-Fi") == [1, 4]
+    assert index_ui_hierarchy(ui_hierarchy).by_resource_id("com.example:id/item") == []
+
+
 def test_find_element_by_resource_id_rich_hierarchy():
     rich_hierarchy = [
         {"attributes": {"resource-id": "com.example:id/button1"}, "children": []},
@@ -170,6 +260,11 @@ def test_element_bounds():
 if __name__ == "__main__":
     test_text_input_is_empty()
     test_find_element_by_resource_id()
+    test_find_element_by_resource_id_with_index()
+    test_index_ui_hierarchy()
+    test_index_ui_hierarchy_deeper_than_recursion_limit()
+    test_hierarchy_index_with_selector_keys()
+    test_index_ui_hierarchy_cache_is_keyed_on_selector_keys()
     test_find_element_by_resource_id_rich_hierarchy()
     test_is_element_focused()
     test_get_element_text()
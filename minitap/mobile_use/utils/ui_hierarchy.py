@@ -1,3 +1,6 @@
+from collections import deque
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 
 from minitap.mobile_use.utils.logger import get_logger
@@ -39,6 +42,118 @@ def text_input_is_empty(text: str | None, hint_text: str | None) -> bool:
     return not text or text == hint_text
 
 
+@dataclass(slots=True)
+class HierarchyIndex:
+    """
+    Selector indices over a UI hierarchy, flat or nested, built in a single traversal.
+
+    Elements are stored in depth-first pre-order, so the n-th match of a selector is the
+    n-th element a recursive search would meet. Resolving an element by resource-id or
+    text becomes a dict lookup plus a list access instead of a scan of the hierarchy.
+    """
+
+    elements: list[dict]
+    id_to_idx: dict[str, list[int]]
+    text_to_idx: dict[str, list[int]]
+    # Same as text_to_idx, keyed by lowercased text for case-insensitive lookups
+    text_lower_to_idx: dict[str, list[int]]
+
+    @classmethod
+    def build(
+        cls,
+        ui_hierarchy: list[dict],
+        id_key: str = "resourceId",
+        text_keys: tuple[str, ...] = ("text",),
+    ) -> "HierarchyIndex":
+        index = cls(elements=[], id_to_idx={}, text_to_idx={}, text_lower_to_idx={})
+        index._add_elements(ui_hierarchy, id_key=id_key, text_keys=text_keys)
+        return index
+
+    def _add_elements(self, ui_hierarchy: list[dict], id_key: str, text_keys: tuple[str, ...]):
+        # Iterative pre-order walk: children are pushed in reverse so that they are popped
+        # in document order, right after their parent
+        stack = [element for element in reversed(ui_hierarchy) if isinstance(element, dict)]
+        while stack:
+            element = stack.pop()
+            i = len(self.elements)
+            self.elements.append(element)
+
+            resource_id = element.get(id_key)
+            if resource_id and isinstance(resource_id, str):
+                self.id_to_idx.setdefault(resource_id, []).append(i)
+
+            attributes = element.get("attributes", element)
+            for key in text_keys:
+                text = attributes.get(key)
+                if text and isinstance(text, str):
+                    _append_once(self.text_to_idx.setdefault(text, []), i)
+                    _append_once(self.text_lower_to_idx.setdefault(text.lower(), []), i)
+
+            if children := element.get("children"):
+                stack.extend(child for child in reversed(children) if isinstance(child, dict))
+
+    def by_resource_id(self, resource_id: str) -> list[int]:
+        return self.id_to_idx.get(resource_id, [])
+
+    def by_text(self, text: str) -> list[int]:
+        return self.text_to_idx.get(text, [])
+
+    def matches(self, resource_id: str | None = None, text: str | None = None) -> list[int]:
+        """Indices of the elements matching the resource-id or the text, in hierarchy order."""
+        by_id = self.by_resource_id(resource_id) if resource_id else []
+        by_text = self.by_text(text) if text else []
+        if by_id and by_text:
+            return sorted(set(by_id).union(by_text))
+        return by_id or by_text
+
+    def find_by_resource_id(self, resource_id: str, index: int | None = None) -> dict | None:
+        return self._nth(self.id_to_idx.get(resource_id), index)
+
+    def find_by_text(self, text: str, index: int | None = None) -> dict | None:
+        """Case-insensitive exact match on the text."""
+        return self._nth(self.text_lower_to_idx.get(text.lower()), index)
+
+    def _nth(self, indices: list[int] | None, index: int | None) -> dict | None:
+        n = index or 0
+        if not indices or n >= len(indices):
+            return None
+        return self.elements[indices[n]]
+
+
+def _append_once(indices: list[int], i: int) -> None:
+    # The same element may expose one text under several keys
+    if not indices or indices[-1] != i:
+        indices.append(i)
+
+
+HIERARCHY_INDEX_CACHE_SIZE = 8
+# Most recently indexed hierarchies, matched by identity. Each entry holds the hierarchy
+# itself, so a list still in the cache can never be mistaken for a new one.
+_recent_indices: deque[tuple[list[dict], str, tuple[str, ...], HierarchyIndex]] = deque(
+    maxlen=HIERARCHY_INDEX_CACHE_SIZE
+)
+
+
+def index_ui_hierarchy(
+    ui_hierarchy: list[dict],
+    id_key: str = "resourceId",
+    text_keys: tuple[str, ...] = ("text",),
+) -> HierarchyIndex:
+    """
+    Returns the index of the given hierarchy, reusing the one built for the same hierarchy
+    object and selector keys among the most recently indexed ones.
+    """
+    text_keys = tuple(text_keys)
+    for i, entry in enumerate(_recent_indices):
+        if entry[0] is ui_hierarchy and entry[1] == id_key and entry[2] == text_keys:
+            del _recent_indices[i]
+            _recent_indices.append(entry)
+            return entry[3]
+    index = HierarchyIndex.build(ui_hierarchy, id_key=id_key, text_keys=text_keys)
+    _recent_indices.append((ui_hierarchy, id_key, text_keys, index))
+    return index
+
+
 def find_element_by_resource_id(
     ui_hierarchy: list[dict],
     resource_id: str,
@@ -59,24 +174,7 @@ def find_element_by_resource_id(
     if is_rich_hierarchy:
         return __find_element_by_ressource_id_in_rich_hierarchy(ui_hierarchy, resource_id)
 
-    def search_recursive(elements: list[dict]) -> dict | None:
-        for element in elements:
-            if isinstance(element, dict):
-                if element.get("resourceId") == resource_id:
-                    idx = index or 0
-                    if idx == 0:
-                        return element
-                    idx -= 1
-                    continue
-
-                children = element.get("children", [])
-                if children:
-                    result = search_recursive(children)
-                    if result:
-                        return result
-        return None
-
-    return search_recursive(ui_hierarchy)
+    return index_ui_hierarchy(ui_hierarchy).find_by_resource_id(resource_id, index)
 
 
 def is_element_focused(element: dict) -> bool:
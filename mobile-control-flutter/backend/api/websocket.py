@@ -2,84 +2,184 @@
 WebSocket管理器 - 处理实时通信
 """
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import List, Optional, Callable
+from collections.abc import Awaitable, Callable
+from collections import deque
 import asyncio
-import json
+import logging
+
+import orjson
+
+# 画面静止时的最长轮询间隔(秒)
+MAX_IDLE_INTERVAL = 2.0
+# 文本消息合并发送前的等待时间(秒)与每批最多合并的消息数
+BATCH_FLUSH_DELAY = 0.005
+MAX_BATCH_SIZE = 32
+
+logger = logging.getLogger(__name__)
+
+
+class ClientWriter:
+    """
+    单个连接的发送任务,在连接的整个生命周期内只创建一个Task
+    
+    文本消息(已序列化的JSON)先入队,由写入任务在短暂等待后合并发送:单条消息按原格式发送,
+    多条消息合并为一个JSON数组,减少send调用和网络帧数量。
+    屏幕帧只保留最新一帧:上一帧未发送完时新帧覆盖旧帧,慢客户端只会丢帧,不会积压
+    """
+    
+    def __init__(self, websocket: WebSocket, on_error: Callable[[WebSocket], None]):
+        self.websocket = websocket
+        self._on_error = on_error
+        self._queue: deque[str] = deque()
+        self._frame: bytes | None = None
+        self._wakeup: asyncio.Future | None = None
+        self._task = asyncio.create_task(self._writer())
+        
+    def enqueue(self, payload: str):
+        """加入待发送的JSON文本并唤醒写入任务"""
+        self._queue.append(payload)
+        self._wake()
+        
+    def set_frame(self, frame: bytes):
+        """设置待发送的屏幕帧,覆盖尚未发送的旧帧"""
+        self._frame = frame
+        self._wake()
+            
+    def close(self):
+        """停止写入任务,丢弃未发送的消息"""
+        self._task.cancel()
+        
+    def _wake(self):
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+        
+    async def _writer(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._queue and self._frame is None:
+                self._wakeup = loop.create_future()
+                await self._wakeup
+                self._wakeup = None
+                # 稍作等待,合并紧随其后的文本消息
+                if self._queue and len(self._queue) < MAX_BATCH_SIZE:
+                    await asyncio.sleep(BATCH_FLUSH_DELAY)
+            
+            try:
+                if self._queue:
+                    batch_size = min(len(self._queue), MAX_BATCH_SIZE)
+                    batch = [self._queue.popleft() for _ in range(batch_size)]
+                    payload = batch[0] if len(batch) == 1 else f"[{','.join(batch)}]"
+                    await self.websocket.send_text(payload)
+                if self._frame is not None:
+                    frame, self._frame = self._frame, None
+                    await self.websocket.send_bytes(frame)
+            except Exception as e:
+                logger.warning("Error sending message: %s", e)
+                self._on_error(self.websocket)
+                return
 
 
 class ConnectionManager:
     """WebSocket连接管理器"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.screen_update_task: Optional[asyncio.Task] = None
+        self.active_connections: list[WebSocket] = []
+        self.screen_update_task: asyncio.Task | None = None
         self.is_running = False
+        self._last_frame: bytes | None = None
+        self._writers: dict[WebSocket, ClientWriter] = {}
         
     async def connect(self, websocket: WebSocket):
         """接受新的WebSocket连接"""
         await websocket.accept()
         self.active_connections.append(websocket)
+        self._writers[websocket] = ClientWriter(websocket, on_error=self.disconnect)
+        # 新客户端需要收到当前画面,即使画面没有变化
+        self._last_frame = None
         
     def disconnect(self, websocket: WebSocket):
         """断开WebSocket连接"""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        writer = self._writers.pop(websocket, None)
+        if writer:
+            writer.close()
         
         # 如果没有活动连接,停止屏幕更新
         if not self.active_connections and self.screen_update_task:
             self.is_running = False
         
     async def send_personal_message(self, message: dict, websocket: WebSocket):
-        """发送消息给特定客户端"""
+        """发送消息给特定客户端(入队后由该连接的写入任务合并发送)"""
+        await self.send_serialized(orjson.dumps(message).decode(), websocket)
+        
+    async def send_serialized(self, payload: str, websocket: WebSocket):
+        """发送已序列化的JSON文本给特定客户端"""
+        writer = self._writers.get(websocket)
+        if writer:
+            writer.enqueue(payload)
+            return
+        
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(payload)
         except Exception as e:
-            print(f"Error sending message: {e}")
+            logger.warning("Error sending message: %s", e)
         
     async def broadcast(self, message: dict):
         """广播消息给所有连接的客户端"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
+        # 只序列化一次,再交给各客户端的写入任务发送
+        # JSON消息仍以文本帧发送,二进制帧专用于屏幕截图
+        payload = orjson.dumps(message).decode()
+        for writer in list(self._writers.values()):
+            writer.enqueue(payload)
         
-        # 移除断开的连接
-        for conn in disconnected:
-            self.disconnect(conn)
+    def send_frame(self, frame: bytes):
+        """以二进制帧发送屏幕截图给所有客户端,不等待发送完成"""
+        for writer in list(self._writers.values()):
+            writer.set_frame(frame)
             
-    async def start_screen_updates(self, get_screenshot_func: Callable, interval: float = 0.5):
+    async def start_screen_updates(
+        self, get_frame_func: Callable[[], Awaitable[bytes]], interval: float = 0.5
+    ):
         """
         启动屏幕更新循环
         
+        屏幕帧以二进制消息直接发送JPEG数据,无需base64编码;其他消息仍为JSON文本
+        
         Args:
-            get_screenshot_func: 获取截图的函数
-            interval: 更新间隔(秒)
+            get_frame_func: 获取JPEG截图的异步函数,画面未变化时返回同一个bytes对象
+            interval: 更新间隔(秒),包含截图和编码所用的时间
         """
         self.is_running = True
+        current_interval = interval
+        loop = asyncio.get_running_loop()
         
         while self.is_running and self.active_connections:
+            started_at = loop.time()
             try:
                 # 获取截图
-                screenshot_b64 = get_screenshot_func()
+                frame = await get_frame_func()
                 
-                # 广播给所有客户端
-                await self.broadcast({
-                    "type": "screen_update",
-                    "data": screenshot_b64
-                })
+                # 画面未变化时跳过广播,并逐步延长轮询间隔;画面变化后恢复原间隔
+                if frame is self._last_frame:
+                    current_interval = min(current_interval * 2, MAX_IDLE_INTERVAL)
+                else:
+                    self._last_frame = frame
+                    current_interval = interval
+                    
+                    # 所有客户端共享同一份帧数据
+                    self.send_frame(frame)
                 
             except Exception as e:
-                print(f"Screen update error: {e}")
+                logger.error("Screen update error: %s", e)
                 # 发送错误消息
                 await self.broadcast({
                     "type": "error",
                     "message": f"屏幕更新失败: {str(e)}"
                 })
             
-            # 等待下一次更新
-            await asyncio.sleep(interval)
+            # 等待下一次更新(扣除本轮截图已用的时间)
+            await asyncio.sleep(max(0.0, current_interval - (loop.time() - started_at)))
         
         self.is_running = False
     
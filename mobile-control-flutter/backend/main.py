@@ -1,11 +1,19 @@
 """
 FastAPI主应用 - 后端服务入口
 """
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import Depends, FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 import asyncio
-import json
-from typing import Optional
+import atexit
+import logging
+import os
+import queue
+import sys
+
+import orjson
+from minitap.mobile_use.utils.logger import route_console_output
 
 from backend.services.device_service import DeviceService
 from backend.services.ai_service import AIService
@@ -18,8 +26,37 @@ from backend.models.schemas import (
     ScreenshotResponse
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期 - 创建服务实例,退出时清理AI服务并断开设备"""
+    app.state.device_service = DeviceService()
+    app.state.ai_service = None
+    # 只在连接/断开等状态切换时加锁,读取服务实例无需加锁
+    app.state.service_lock = asyncio.Lock()
+    
+    yield
+    
+    manager.stop_screen_updates()
+    ai_service: AIService | None = app.state.ai_service
+    if ai_service:
+        await ai_service.cleanup()
+    app.state.device_service.disconnect()
+
+
+def get_device_service(request: Request) -> DeviceService:
+    """依赖注入:设备服务"""
+    return request.app.state.device_service
+
+
+logger = logging.getLogger(__name__)
+
+# 客户端心跳消息的原始文本(与Flutter端jsonEncode的输出一致),命中时跳过JSON解析
+PING_MESSAGE = '{"type":"ping"}'
+PONG_MESSAGE = orjson.dumps({"type": "pong"}).decode()
+
+
 # 创建FastAPI应用
-app = FastAPI(title="Mobile Control Backend", version="1.0.0")
+app = FastAPI(title="Mobile Control Backend", version="1.0.0", lifespan=lifespan)
 
 # 配置CORS
 app.add_middleware(
@@ -30,11 +67,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 全局服务实例
-device_service = DeviceService()
-ai_service: Optional[AIService] = None
-
-
 @app.get("/")
 async def root():
     """根路径"""
@@ -45,45 +77,54 @@ async def root():
 
 
 @app.get("/api/devices", response_model=list[DeviceInfo])
-async def list_devices():
+async def list_devices(device_service: DeviceService = Depends(get_device_service)):
     """获取设备列表"""
-    devices = device_service.list_devices()
+    devices = await device_service.list_devices()
     return devices
 
 
 @app.post("/api/connect")
-async def connect_device(request: ConnectRequest):
+async def connect_device(
+    request: ConnectRequest,
+    http_request: Request,
+    device_service: DeviceService = Depends(get_device_service)
+):
     """连接设备"""
-    global ai_service
-    
-    result = device_service.connect_device(request.device_id)
+    state = http_request.app.state
     
-    if not result.get("success"):
-        raise HTTPException(status_code=500, detail=result.get("error"))
-    
-    # 初始化AI服务
-    ai_service = AIService(request.device_id)
-    init_result = await ai_service.initialize()
-    
-    if not init_result.get("success"):
-        print(f"Warning: AI service initialization failed: {init_result.get('error')}")
-        # 不阻止连接,仅记录警告
+    async with state.service_lock:
+        # 连接过程包含多次同步ADB调用,在线程中执行
+        result = await asyncio.to_thread(device_service.connect_device, request.device_id)
+        
+        if not result.get("success"):
+            raise HTTPException(status_code=500, detail=result.get("error"))
+        
+        # 初始化AI服务(先清理上一次连接的AI服务及其事件循环线程)
+        if state.ai_service:
+            await state.ai_service.cleanup()
+        ai_service = AIService(request.device_id)
+        init_result = await ai_service.initialize()
+        state.ai_service = ai_service
+        
+        if not init_result.get("success"):
+            logger.warning("AI service initialization failed: %s", init_result.get("error"))
+            # 不阻止连接,仅记录警告
     
     return result
 
 
 @app.get("/api/screenshot")
-async def get_screenshot():
+async def get_screenshot(device_service: DeviceService = Depends(get_device_service)):
     """获取截图"""
     try:
-        screenshot = device_service.get_screenshot()
+        screenshot = await device_service.get_screenshot()
         return ScreenshotResponse(success=True, data=screenshot)
     except Exception as e:
         return ScreenshotResponse(success=False, error=str(e))
 
 
 @app.post("/api/control/lock")
-async def lock_screen():
+async def lock_screen(device_service: DeviceService = Depends(get_device_service)):
     """锁屏"""
     try:
         result = device_service.press_power()
@@ -93,39 +134,46 @@ async def lock_screen():
 
 
 @app.post("/api/control/refresh")
-async def refresh_screen():
+async def refresh_screen(device_service: DeviceService = Depends(get_device_service)):
     """刷新屏幕(手动触发截图)"""
-    return await get_screenshot()
+    return await get_screenshot(device_service)
 
 
 @app.post("/api/control/disconnect")
-async def disconnect_device():
+async def disconnect_device(
+    http_request: Request,
+    device_service: DeviceService = Depends(get_device_service)
+):
     """断开连接"""
-    global ai_service
-    
-    # 清理AI服务
-    if ai_service:
-        await ai_service.cleanup()
-        ai_service = None
-    
-    # 停止屏幕更新
-    manager.stop_screen_updates()
+    state = http_request.app.state
     
-    # 断开设备
-    result = device_service.disconnect()
+    async with state.service_lock:
+        # 清理AI服务
+        if state.ai_service:
+            await state.ai_service.cleanup()
+            state.ai_service = None
+        
+        # 停止屏幕更新
+        manager.stop_screen_updates()
+        
+        # 断开设备
+        result = device_service.disconnect()
     return result
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket连接端点"""
+    # 服务实例在应用生命周期内创建,只查找一次
+    state = websocket.app.state
+    device_service: DeviceService = state.device_service
     await manager.connect(websocket)
     
     # 启动屏幕更新任务
     if not manager.is_running:
         manager.screen_update_task = asyncio.create_task(
             manager.start_screen_updates(
-                get_screenshot_func=device_service.get_screenshot,
+                get_frame_func=device_service.get_screen_frame,
                 interval=0.5  # 每500ms更新一次
             )
         )
@@ -134,7 +182,12 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             # 接收客户端消息
             data = await websocket.receive_text()
-            message = json.loads(data)
+            if data == PING_MESSAGE:
+                # 心跳响应(预先序列化)
+                await manager.send_serialized(PONG_MESSAGE, websocket)
+                continue
+            
+            message = orjson.loads(data)
             
             if message.get("type") == "ai_command":
                 command = message.get("command", "")
@@ -145,7 +198,8 @@ async def websocket_endpoint(websocket: WebSocket):
                     "message": "AI正在分析并执行命令..."
                 }, websocket)
                 
-                # 执行AI命令
+                # 执行AI命令(AI服务可能在连接/断开设备时被替换,每条命令读取当前实例)
+                ai_service = state.ai_service
                 if ai_service and ai_service.initialized:
                     result = await ai_service.execute_command(command)
                     
@@ -171,22 +225,66 @@ async def websocket_endpoint(websocket: WebSocket):
                 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
-        print("Client disconnected")
-    except Exception as e:
-        print(f"WebSocket error: {e}")
+        logger.info("Client disconnected")
+    except Exception:
+        logger.error("WebSocket error", exc_info=True)
         manager.disconnect(websocket)
 
 
+class _QueuedLogFormatter(logging.Formatter):
+    """mobile-use日志在入队时已按其彩色格式格式化,原样输出;其余日志使用uvicorn风格的格式"""
+    
+    def __init__(self):
+        super().__init__("%(levelname)s:     %(name)s - %(message)s")
+        
+    def format(self, record: logging.LogRecord) -> str:
+        if hasattr(record, "log_level"):
+            return record.getMessage()
+        return super().format(record)
+
+
+def configure_logging():
+    """日志通过队列交给后台线程输出,事件循环中只做入队"""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_QueuedLogFormatter())
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    # mobile-use的日志器自带同步写stdout的处理器,改为写入同一队列(且不再传递给根日志器,避免重复输出)
+    route_console_output(lambda: QueueHandler(log_queue))
+
+
 if __name__ == "__main__":
     import uvicorn
+    from uvicorn.config import LOGGING_CONFIG
+    
+    # 设备、AI服务和屏幕推送状态都保存在进程内,多个工作进程需要在前面加按设备/客户端的粘性路由
+    workers = int(os.environ.get("BACKEND_WORKERS", "1"))
+    if workers == 1:
+        configure_logging()
     print("Starting Mobile Control Backend...")
     print("API available at: http://127.0.0.1:8000")
     print("WebSocket available at: ws://127.0.0.1:8000/ws")
     print("API docs available at: http://127.0.0.1:8000/docs")
     
+    # 使用uvloop事件循环与httptools解析器以降低WebSocket延迟(Windows不支持uvloop,回退到asyncio)
     uvicorn.run(
-        app,
+        # 多进程时uvicorn需要通过导入路径在各工作进程中加载应用
+        "backend.main:app" if workers > 1 else app,
+        workers=workers,
         host="127.0.0.1",
         port=8000,
-        log_level="info"
+        log_level="info",
+        # 单进程时不使用uvicorn自带的日志配置,其日志经由根日志器的队列输出
+        log_config=None if workers == 1 else LOGGING_CONFIG,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+        # 屏幕帧已是JPEG,压缩不再减小体积;关闭permessage-deflate,避免为每个客户端重复压缩同一帧
+        ws_per_message_deflate=False
     )
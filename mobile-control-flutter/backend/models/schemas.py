@@ -1,35 +1,55 @@
 """
 数据模型定义
 """
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DeviceInfo(BaseModel):
     """设备信息"""
+    model_config = ConfigDict(frozen=True)
+    
     serial: str
     state: str
 
 
 class ConnectRequest(BaseModel):
     """连接请求"""
+    model_config = ConfigDict(extra="forbid")
+    
     device_id: str
 
 
 class CommandRequest(BaseModel):
     """AI命令请求"""
+    model_config = ConfigDict(extra="forbid")
+    
     command: str
 
 
 class CommandResponse(BaseModel):
     """命令响应"""
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
-    result: Optional[str] = None
-    error: Optional[str] = None
+    result: str | None = None
+    error: str | None = None
 
 
 class ScreenshotResponse(BaseModel):
     """截图响应"""
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
-    data: Optional[str] = None
-    error: Optional[str] = None
+    # base64编码的JPEG,不放入repr,避免日志中输出整张图片
+    data: str | None = Field(default=None, repr=False)
+    error: str | None = None
+
+
+class TaskResult(BaseModel):
+    """AI任务执行结果"""
+    model_config = ConfigDict(frozen=True)
+    
+    success: bool
+    command: str | None = None
+    result: str | dict | None = None
+    error: str | None = None
@@ -2,19 +2,32 @@
 AI Service - AI Agent服务
 集成mobile-use的AI Agent进行自然语言命令执行
 """
-import sys
 import asyncio
-from pathlib import Path
-from typing import Optional
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
-# 添加mobile-use到Python路径
-mobile_use_path = Path(__file__).parent.parent.parent.parent / "minitap"
-sys.path.insert(0, str(mobile_use_path))
+from pydantic import BaseModel
 
 from minitap.mobile_use.sdk import Agent
 from minitap.mobile_use.sdk.builders import Builders
 from minitap.mobile_use.sdk.types.task import AgentProfile
 from minitap.mobile_use.config import initialize_llm_config
+from backend.models.schemas import TaskResult
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+async def _cancel_all_tasks():
+    """取消当前事件循环中除自身外的所有任务,并等待它们结束"""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class AIService:
@@ -22,9 +35,23 @@ class AIService:
     
     def __init__(self, device_id: str):
         self.device_id = device_id
-        self.agent: Optional[Agent] = None
+        self.agent: Agent | None = None
         self.initialized = False
         
+        # Agent在独立线程的事件循环中运行,其中的同步阻塞步骤不会卡住WebSocket和屏幕更新
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name=f"ai-agent-{device_id}", daemon=True
+        )
+        self._thread.start()
+        
+    async def _run_in_agent_loop(self, coro: Coroutine[Any, Any, T]) -> T:
+        """在Agent的事件循环中执行协程并等待结果"""
+        if self._loop.is_closed():
+            coro.close()
+            raise RuntimeError("AI service has been cleaned up")
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+        
     async def initialize(self):
         """初始化AI Agent"""
         try:
@@ -42,7 +69,7 @@ class AIService:
             self.agent = Agent(config=config.build())
             
             # 初始化Agent
-            await self.agent.init(retry_count=3, retry_wait_seconds=2)
+            await self._run_in_agent_loop(self.agent.init(retry_count=3, retry_wait_seconds=2))
             
             self.initialized = True
             return {"success": True, "message": "AI Agent initialized"}
@@ -59,10 +86,9 @@ class AIService:
             callback: 回调函数,用于实时发送思考过程
         """
         if not self.initialized or not self.agent:
-            return {
-                "success": False,
-                "error": "Agent not initialized"
-            }
+            return TaskResult(success=False, error="Agent not initialized").model_dump(
+                mode="json", exclude_none=True
+            )
         
         try:
             # 创建任务
@@ -72,23 +98,49 @@ class AIService:
             # task.with_thoughts_output_saving(path="thoughts.txt")
             
             # 执行任务
-            result = await self.agent.run_task(request=task.build())
-            
-            return {
-                "success": True,
-                "command": command,
-                "result": str(result) if result else "命令执行完成"
-            }
+            result = await self._run_in_agent_loop(self.agent.run_task(request=task.build()))
+        except asyncio.CancelledError:
+            # 调用方自身被取消时继续向上传递;Agent被清理导致的取消作为失败结果返回
+            current_task = asyncio.current_task()
+            if current_task and current_task.cancelling():
+                raise
+            return TaskResult(success=False, error="任务已取消").model_dump(
+                mode="json", exclude_none=True
+            )
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return TaskResult(success=False, error=str(e)).model_dump(
+                mode="json", exclude_none=True
+            )
+        
+        # 结构化结果原样返回,由WebSocket发送时统一序列化,不再转成字符串;
+        # 类型化的输出(pydantic模型)先转为dict
+        if isinstance(result, BaseModel):
+            result = result.model_dump(mode="json")
+        task_result = TaskResult(
+            success=True,
+            command=command,
+            result=result if result else "命令执行完成"
+        )
+        return task_result.model_dump(mode="json", exclude_none=True)
     
     async def cleanup(self):
-        """清理资源"""
-        if self.agent:
+        """清理资源,之后的命令直接返回未初始化的错误"""
+        if self._loop.is_closed():
+            return
+        # 先标记为未初始化,清理期间到达的命令不再调度到即将关闭的事件循环
+        self.initialized = False
+        agent, self.agent = self.agent, None
+        
+        # 先取消Agent事件循环中仍在运行的任务(如进行中的命令),让等待它们的调用方得到结果
+        await self._run_in_agent_loop(_cancel_all_tasks())
+        
+        if agent:
             try:
-                await self.agent.clean()
-            except Exception as e:
-                print(f"Error cleaning up agent: {e}")
+                await self._run_in_agent_loop(agent.clean())
+            except Exception:
+                logger.error("Error cleaning up agent", exc_info=True)
+        
+        # 停止Agent的事件循环线程
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        await asyncio.to_thread(self._thread.join)
+        self._loop.close()
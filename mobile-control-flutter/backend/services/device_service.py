@@ -2,19 +2,23 @@
 Device Service - 设备连接和控制服务
 复用mobile-use项目的Android设备控制功能
 """
-import sys
-import os
-from typing import Optional
-from pathlib import Path
-
-# 添加mobile-use到Python路径
-mobile_use_path = Path(__file__).parent.parent.parent.parent / "minitap"
-sys.path.insert(0, str(mobile_use_path))
+import asyncio
+import logging
+import time
 
 from adbutils import AdbClient, AdbDevice
 from minitap.mobile_use.clients.ui_automator_client import UIAutomatorClient
 from minitap.mobile_use.controllers.android_controller import AndroidDeviceController
 import base64
+import hashlib
+import io
+
+# 屏幕帧的JPEG质量。JPEG在后端编码,比PNG小5-10倍,代价是每帧多一次后端CPU编码
+SCREEN_FRAME_JPEG_QUALITY = 80
+# 屏幕尺寸缓存的有效期(秒),过期后重新查询以反映屏幕旋转等变化
+WINDOW_SIZE_CACHE_TTL_SECONDS = 30.0
+
+logger = logging.getLogger(__name__)
 
 
 class DeviceService:
@@ -22,25 +26,45 @@ class DeviceService:
     
     def __init__(self):
         self.adb_client = AdbClient(host="127.0.0.1", port=5037)
-        self.device_controller: Optional[AndroidDeviceController] = None
-        self.ui_client: Optional[UIAutomatorClient] = None
-        self.current_device_id: Optional[str] = None
+        self.device_controller: AndroidDeviceController | None = None
+        self.ui_client: UIAutomatorClient | None = None
+        self.current_device_id: str | None = None
         self.device_width: int = 0
         self.device_height: int = 0
+        # 设备序列号 -> (设备句柄, 屏幕尺寸, 查询时间)
+        self._device_cache: dict[str, tuple[AdbDevice, tuple[int, int], float]] = {}
+        # 上一帧原始像素的哈希及其JPEG编码,画面未变化时跳过编码。
+        # 两者作为一个元组整体赋值,并发的截图(REST接口与屏幕推送)不会把一帧的哈希与另一帧的JPEG配对
+        self._last_capture: tuple[bytes, bytes] | None = None
         
-    def list_devices(self) -> list[dict]:
-        """列出所有连接的设备"""
+    async def list_devices(self) -> list[dict]:
+        """列出所有连接的设备(在线程中执行ADB查询,避免阻塞事件循环)"""
+        return await asyncio.to_thread(self._list_devices_blocking)
+    
+    def _list_devices_blocking(self) -> list[dict]:
         devices = []
         try:
-            for device in self.adb_client.device_list():
+            # 一次ADB请求同时获取序列号和状态
+            for device in self.adb_client.list():
                 devices.append({
                     "serial": device.serial,
                     "state": device.state
                 })
-        except Exception as e:
-            print(f"Error listing devices: {e}")
+        except Exception:
+            logger.error("Error listing devices", exc_info=True)
         return devices
     
+    def _get_device(self, device_id: str) -> tuple[AdbDevice, tuple[int, int]]:
+        """获取设备句柄和屏幕尺寸,在缓存有效期内复用,避免每次连接都重新查询"""
+        cached = self._device_cache.get(device_id)
+        if cached and time.monotonic() - cached[2] < WINDOW_SIZE_CACHE_TTL_SECONDS:
+            return cached[0], cached[1]
+        
+        device = self.adb_client.device(device_id)
+        size = device.window_size()
+        self._device_cache[device_id] = (device, (size.width, size.height), time.monotonic())
+        return device, (size.width, size.height)
+    
     def connect_device(self, device_id: str) -> dict:
         """连接到指定设备"""
         try:
@@ -50,10 +74,7 @@ class DeviceService:
             self.ui_client = UIAutomatorClient(device_id)
             
             # 获取设备尺寸
-            device = self.adb_client.device(device_id)
-            size = device.window_size()
-            self.device_width = size.width
-            self.device_height = size.height
+            _, (self.device_width, self.device_height) = self._get_device(device_id)
             
             # 初始化设备控制器
             self.device_controller = AndroidDeviceController(
@@ -76,17 +97,44 @@ class DeviceService:
                 "error": str(e)
             }
     
-    def get_screenshot(self) -> str:
-        """获取设备截图(base64编码)"""
-        if not self.device_controller:
+    async def get_screen_frame(self) -> bytes:
+        """获取设备截图(JPEG编码),画面未变化时返回同一个bytes对象"""
+        if not self.ui_client:
             raise ValueError("No device connected")
         
         try:
-            # 获取截图(base64格式)
-            screenshot_b64 = self.device_controller.screenshot()
-            return screenshot_b64
+            # 只截图不抓取UI层级,复用UIAutomator2的长连接;在线程中执行,避免阻塞事件循环
+            frame = await asyncio.to_thread(self._capture_jpeg, self.ui_client)
         except Exception as e:
             raise Exception(f"Failed to get screenshot: {e}")
+        
+        if frame is None:
+            raise Exception("Failed to get screenshot: no image captured")
+        return frame
+    
+    def _capture_jpeg(self, ui_client: UIAutomatorClient) -> bytes | None:
+        """截图并编码为JPEG,截图失败时返回None"""
+        image = ui_client.get_screenshot()
+        if image is None:
+            return None
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        
+        # 静止画面很常见,哈希原始像素远比JPEG编码便宜
+        pixels_hash = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        last_capture = self._last_capture
+        if last_capture is not None and last_capture[0] == pixels_hash:
+            return last_capture[1]
+        
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=SCREEN_FRAME_JPEG_QUALITY)
+        frame = buffer.getvalue()
+        self._last_capture = (pixels_hash, frame)
+        return frame
+    
+    async def get_screenshot(self) -> str:
+        """获取设备截图(base64编码的JPEG,供REST接口使用)"""
+        return base64.b64encode(await self.get_screen_frame()).decode()
     
     def press_power(self):
         """按电源键(锁屏/唤醒)"""
@@ -108,6 +156,7 @@ class DeviceService:
             self.device_controller = None
             self.ui_client = None
             self.current_device_id = None
+            self._last_capture = None
             
             return {"success": True}
         except Exception as e:
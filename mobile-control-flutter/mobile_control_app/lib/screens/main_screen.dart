@@ -4,6 +4,7 @@ Main Screen - 主界面
 import 'package:flutter/material.dart';
 import 'package:http/http.dart' as http;
 import 'dart:convert';
+import 'dart:typed_data';
 import '../services/websocket_service.dart';
 import '../models/message.dart';
 import '../widgets/screen_display.dart';
@@ -19,7 +20,7 @@ class MainScreen extends StatefulWidget {
 
 class _MainScreenState extends State<MainScreen> {
   final WebSocketService _wsService = WebSocketService();
-  String? _currentScreenshot;
+  Uint8List? _currentScreenshot;
   List<ChatMessage> _messages = [];
   bool _isConnected = false;
   String _statusMessage = '未连接';
@@ -61,7 +62,9 @@ class _MainScreenState extends State<MainScreen> {
         
         // 添加响应消息
         final success = response['success'] ?? false;
-        final result = response['result'] ?? response['error'] ?? '未知响应';
+        final value = response['result'] ?? response['error'] ?? '未知响应';
+        // 结构化结果(JSON对象)转为文本显示
+        final result = value is String ? value : jsonEncode(value);
         
         _messages.add(ChatMessage(
           text: success ? '✓ $result' : '✗ $result',
@@ -2,13 +2,14 @@
 WebSocket Service - 后端通信服务
 """
 import 'dart:convert';
+import 'dart:typed_data';
 import 'package:web_socket_channel/web_socket_channel.dart';
 
 class WebSocketService {
   WebSocketChannel? _channel;
   
   // 回调函数
-  Function(String)? onScreenUpdate;
+  Function(Uint8List)? onScreenUpdate;
   Function(Map<String, dynamic>)? onAIResponse;
   Function(String)? onAIThinking;
   Function(String)? onError;
@@ -30,8 +31,20 @@ class WebSocketService {
       _channel!.stream.listen(
         (message) {
           try {
+            // 屏幕帧以二进制(JPEG)发送,其他消息为JSON文本
+            if (message is! String) {
+              onScreenUpdate?.call(Uint8List.fromList(message as List<int>));
+              return;
+            }
+            // 多条消息可能被合并为一个JSON数组
             final data = jsonDecode(message);
-            _handleMessage(data);
+            if (data is List) {
+              for (final item in data) {
+                _handleMessage(item);
+              }
+            } else {
+              _handleMessage(data);
+            }
           } catch (e) {
             print('Error parsing message: $e');
           }
@@ -59,10 +72,6 @@ class WebSocketService {
     final type = data['type'];
     
     switch (type) {
-      case 'screen_update':
-        onScreenUpdate?.call(data['data']);
-        break;
-        
       case 'ai_response':
         onAIResponse?.call(data['result']);
         break;
@@ -1,12 +1,11 @@
 """
 Screen Display Widget - 显示手机屏幕
 """
-import 'dart:convert';
 import 'dart:typed_data';
 import 'package:flutter/material.dart';
 
 class ScreenDisplay extends StatelessWidget {
-  final String? screenshot;
+  final Uint8List? screenshot;
   
   const ScreenDisplay({Key? key, this.screenshot}) : super(key: key);
   
@@ -22,8 +21,9 @@ class ScreenDisplay extends StatelessWidget {
           ? ClipRRect(
               borderRadius: BorderRadius.circular(6),
               child: Image.memory(
-                base64Decode(screenshot!)  ,
+                screenshot!,
                 fit: BoxFit.contain,
+                gaplessPlayback: true,
                 errorBuilder: (context, error, stackTrace) {
                   return Center(
                     child: Column(
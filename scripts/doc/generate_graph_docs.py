@@ -41,7 +41,7 @@ async def generate_graph_docs():
     graph: CompiledStateGraph = await get_graph(ctx)
 
     png_path = Path(__file__).parent.parent.parent / "doc" / "graph.png"
-    print(f"Generating PNG at {png_path}...")
+    mermaid_path = png_path.with_suffix(".mmd")
 
     mermaid_text = graph.get_graph().draw_mermaid(
         node_colors=NodeStyles(
@@ -59,12 +59,23 @@ async def generate_graph_docs():
         },
     )
 
+    # Rendering goes through the mermaid.ink API: skip it when the graph has not changed
+    if (
+        png_path.exists()
+        and mermaid_path.exists()
+        and mermaid_path.read_text(encoding="utf-8") == mermaid_text
+    ):
+        print(f"Graph unchanged, keeping {png_path}")
+        return
+
+    print(f"Generating PNG at {png_path}...")
     draw_mermaid_png(
         mermaid_syntax=mermaid_text,
         output_file_path=str(png_path),
         draw_method=MermaidDrawMethod.API,
         background_color=None,
     )
+    mermaid_path.write_text(mermaid_text, encoding="utf-8")
 
 
 if __name__ == "__main__":